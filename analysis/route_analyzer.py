@@ -13,6 +13,8 @@ import datetime
 import math
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 import googlemaps
 from PIL import Image
@@ -99,6 +101,10 @@ class RouteAnalyzer:
         else:
             self.gmaps = None
             print("⚠️ Google Maps API key not configured")
+        
+        # Keep-alive session shared by the (concurrent) turn image downloads
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
     
     def analyze_csv_route(self, csv_file_path: str, user_id: str) -> Optional[str]:
         """Complete route analysis from CSV file - UPDATED to use coordinate-based POI storage"""
@@ -419,20 +425,25 @@ class RouteAnalyzer:
         # Store images for the most critical turns (top 10)
         critical_turns = [turn for turn in sharp_turns if turn['angle'] >= 70][:10]
         
-        for i, turn in enumerate(critical_turns):
-            try:
-                lat, lng = turn['lat'], turn['lng']
-                
-                # Store street view image
-                self._store_street_view_image(route_id, lat, lng, f"turn_{i+1}")
-                
-                # Store satellite image
-                self._store_satellite_image(route_id, lat, lng, f"turn_{i+1}")
-                
-                time.sleep(0.1)  # Rate limiting
-                
-            except Exception as e:
-                print(f"Error storing images for turn {i+1}: {e}")
+        # The downloads are network-bound, so a few turns are fetched at a time over the
+        # pooled session; the worker count also bounds the request rate
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for i, turn in enumerate(critical_turns):
+                executor.submit(self._store_turn_image_pair, route_id, turn, i)
+    
+    def _store_turn_image_pair(self, route_id: str, turn: Dict, i: int):
+        """Store street view and satellite images for one critical turn"""
+        try:
+            lat, lng = turn['lat'], turn['lng']
+            
+            # Store street view image
+            self._store_street_view_image(route_id, lat, lng, f"turn_{i+1}")
+            
+            # Store satellite image
+            self._store_satellite_image(route_id, lat, lng, f"turn_{i+1}")
+            
+        except Exception as e:
+            print(f"Error storing images for turn {i+1}: {e}")
     
     def _store_street_view_image(self, route_id: str, lat: float, lng: float, 
                                 identifier: str) -> bool:
@@ -452,7 +463,7 @@ class RouteAnalyzer:
                     'key': self.google_api_key
                 }
                 
-                response = requests.get(url, params=params, timeout=15)
+                response = self._http.get(url, params=params, timeout=15)
                 response_time = time.time() - start_time
                 
                 # Log API usage
@@ -510,7 +521,7 @@ class RouteAnalyzer:
                 'key': self.google_api_key
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = self._http.get(url, params=params, timeout=15)
             response_time = time.time() - start_time
             
             # Log API usage
@@ -895,6 +906,9 @@ class RouteAnalyzer:
                 
                 conn.commit()
                 print(f"✅ Stored traffic data for {stored_count} segments in database")
+            
+            # Reports must not serve the analysis cached before these rows existed
+            self.db_manager.clear_traffic_cache(route_id)
                 
         except Exception as e:
             print(f"❌ Error storing traffic data: {e}")
@@ -1024,7 +1038,7 @@ class RouteAnalyzer:
                 with sqlite3.connect(self.db_manager.db_path) as conn:
                     conn.row_factory = sqlite3.Row
                     cursor = conn.cursor()
-                    cursor.execute("SELECT * FROM traffic_data WHERE route_id = ?", (route_id,))
+                    cursor.execute("SELECT * FROM traffic_data WHERE route_id = ? ORDER BY id", (route_id,))
                     traffic_data = [dict(row) for row in cursor.fetchall()]
             except:
                 pass
@@ -1116,7 +1130,7 @@ class RouteAnalyzer:
             # Make API request
             print(f"   🌐 Making API request...")
             start_time = time.time()
-            response = requests.get(final_url, timeout=30)
+            response = self._http.get(final_url, timeout=30)
             response_time = time.time() - start_time
             
             self.api_tracker.log_api_call(
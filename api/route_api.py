@@ -4,10 +4,17 @@
 # Author: Route Analysis System
 # Created: 2024
 
+import re
 import json
+import math
 import datetime
+from collections import defaultdict
 from typing import Dict, List, Any, Optional
 
+_RE_HOURS = re.compile(r'(\d+)\s*hour')
+_RE_MINUTES = re.compile(r'(\d+)\s*min')
+_RE_NUM = re.compile(r'([\d,]+)')
+
 class RouteAPI:
     """REST API interface for route data access"""
     
@@ -153,19 +160,16 @@ class RouteAPI:
                 'moderate_turns': [t for t in sharp_turns if 45 <= t['angle'] < 70]
             }
             
+            # Bucket images into 0.001 deg grid cells once, so each turn only
+            # looks at the 3x3 cells around it
+            street_view_grid = self._image_grid(turn_images)
+            satellite_grid = self._image_grid(satellite_images)
+            
             # Add image information to turns
             for category in categorized_turns.values():
                 for turn in category:
-                    turn['street_view_images'] = [
-                        img for img in turn_images 
-                        if abs(img['latitude'] - turn['latitude']) < 0.001 and 
-                           abs(img['longitude'] - turn['longitude']) < 0.001
-                    ]
-                    turn['satellite_images'] = [
-                        img for img in satellite_images 
-                        if abs(img['latitude'] - turn['latitude']) < 0.001 and 
-                           abs(img['longitude'] - turn['longitude']) < 0.001
-                    ]
+                    turn['street_view_images'] = self._images_near(turn, street_view_grid)
+                    turn['satellite_images'] = self._images_near(turn, satellite_grid)
             
             return {
                 'total_turns': len(sharp_turns),
@@ -184,6 +188,42 @@ class RouteAPI:
         except Exception as e:
             return {'error': str(e)}
     
+    _GRID_CELL = 0.001  # Degrees; matches the turn/image proximity threshold
+    
+    @classmethod
+    def _grid_key(cls, lat: float, lng: float):
+        """Grid cell containing a coordinate"""
+        return math.floor(lat / cls._GRID_CELL), math.floor(lng / cls._GRID_CELL)
+    
+    @classmethod
+    def _image_grid(cls, images: List[Dict]) -> Dict:
+        """Spatial hash of (index, lat, lng, image) entries keyed by grid cell"""
+        grid = defaultdict(list)
+        for idx, img in enumerate(images):
+            if img['latitude'] is None or img['longitude'] is None:
+                continue
+            lat, lng = float(img['latitude']), float(img['longitude'])
+            grid[cls._grid_key(lat, lng)].append((idx, lat, lng, img))
+        return grid
+    
+    @classmethod
+    def _images_near(cls, turn: Dict, grid: Dict, threshold: float = 0.001) -> List[Dict]:
+        """Images within threshold degrees of the turn in both lat and lng"""
+        if not grid:
+            return []
+        t_lat, t_lng = float(turn['latitude']), float(turn['longitude'])
+        row, col = cls._grid_key(t_lat, t_lng)
+        matches = [
+            entry
+            for d_row in (-1, 0, 1)
+            for d_col in (-1, 0, 1)
+            for entry in grid.get((row + d_row, col + d_col), ())
+            if abs(entry[1] - t_lat) < threshold and abs(entry[2] - t_lng) < threshold
+        ]
+        # Keep the images in their stored order
+        matches.sort(key=lambda entry: entry[0])
+        return [entry[3] for entry in matches]
+    
     def get_points_of_interest(self, route_id: str) -> Dict[str, Any]:
         """Get POI data (Page 3: Points of Interest)"""
         try:
@@ -458,32 +498,33 @@ class RouteAPI:
                 if not elevation_data:
                     return {'error': 'No elevation data available'}
                 
-                # Calculate elevation statistics
-                elevations = [point['elevation'] for point in elevation_data]
+                # Calculate elevation statistics over one float array
+                import numpy as np
+                elevations = np.fromiter((point['elevation'] for point in elevation_data),
+                                         dtype=np.float64, count=len(elevation_data))
                 
-                min_elevation = min(elevations)
-                max_elevation = max(elevations)
-                avg_elevation = sum(elevations) / len(elevations)
+                min_elevation = float(elevations.min())
+                max_elevation = float(elevations.max())
+                avg_elevation = float(elevations.mean())
                 elevation_range = max_elevation - min_elevation
                 
-                # Identify significant elevation changes
+                # Identify significant elevation changes (50m threshold) in one vectorized
+                # scan; dicts are built only for the points that pass it
                 significant_changes = []
-                for i in range(1, len(elevation_data)):
+                steps = np.diff(elevations)
+                for i in (np.flatnonzero(np.abs(steps) > 50) + 1).tolist():
                     prev_elevation = elevation_data[i-1]['elevation']
                     curr_elevation = elevation_data[i]['elevation']
-                    change = abs(curr_elevation - prev_elevation)
-                    
-                    if change > 50:  # 50m threshold for significant change
-                        significant_changes.append({
-                            'location': {
-                                'latitude': elevation_data[i]['latitude'],
-                                'longitude': elevation_data[i]['longitude']
-                            },
-                            'elevation_change': change,
-                            'type': 'ascent' if curr_elevation > prev_elevation else 'descent',
-                            'from_elevation': prev_elevation,
-                            'to_elevation': curr_elevation
-                        })
+                    significant_changes.append({
+                        'location': {
+                            'latitude': elevation_data[i]['latitude'],
+                            'longitude': elevation_data[i]['longitude']
+                        },
+                        'elevation_change': abs(curr_elevation - prev_elevation),
+                        'type': 'ascent' if curr_elevation > prev_elevation else 'descent',
+                        'from_elevation': prev_elevation,
+                        'to_elevation': curr_elevation
+                    })
                 
                 # Classify terrain
                 terrain_type = self._classify_terrain(elevation_range, avg_elevation)
@@ -836,16 +877,16 @@ class RouteAPI:
     def _parse_duration_to_hours(self, duration_str: str) -> float:
         """Parse duration string to hours"""
         try:
-            import re
             hours = 0
+            duration_lower = duration_str.lower()
             
             # Extract hours
-            hour_match = re.search(r'(\d+)\s*hour', duration_str.lower())
+            hour_match = _RE_HOURS.search(duration_lower)
             if hour_match:
                 hours += int(hour_match.group(1))
             
             # Extract minutes
-            min_match = re.search(r'(\d+)\s*min', duration_str.lower())
+            min_match = _RE_MINUTES.search(duration_lower)
             if min_match:
                 hours += int(min_match.group(1)) / 60
             
@@ -856,9 +897,8 @@ class RouteAPI:
     def _parse_distance_to_km(self, distance_str: str) -> float:
         """Parse distance string to kilometers"""
         try:
-            import re
             if 'km' in distance_str.lower():
-                km_match = re.search(r'([\d,]+)', distance_str)
+                km_match = _RE_NUM.search(distance_str)
                 if km_match:
                     return float(km_match.group(1).replace(',', ''))
             return 0
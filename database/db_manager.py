@@ -290,6 +290,32 @@ class DatabaseManager:
                 )
             """)
             
+            # Traffic cache - aggregated traffic analysis keyed by route
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS traffic_cache (
+                    route_id TEXT PRIMARY KEY,
+                    fetched_at REAL NOT NULL,
+                    json TEXT NOT NULL,
+                    FOREIGN KEY (route_id) REFERENCES routes (id)
+                )
+            """)
+            
+            # Indexes for per-route turn lookups and turn/image proximity joins
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sharp_turns_route ON sharp_turns(route_id, angle)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_stored_images_route_lat ON stored_images(route_id, latitude)")
+            
+            # Per-route lookups of the high-risk zone queries. Elevation rows are read
+            # in id order, which a route_id index already covers (rowid is its last key);
+            # the others also filter on the risk column
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_elevation_data_route ON elevation_data(route_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_traffic_data_route_congestion ON traffic_data(route_id, congestion_level)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_network_coverage_route_dead ON network_coverage(route_id, is_dead_zone)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_environmental_risks_route_severity ON environmental_risks(route_id, severity)")
+            
+            # Superseded by the composite indexes above
+            for old_index in ('idx_traffic_data_route', 'idx_network_coverage_route', 'idx_environmental_risks_route'):
+                cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
+            
             # SAFE COLUMN ADDITIONS TO EXISTING POIS TABLE
             # Check existing columns first
             cursor.execute("PRAGMA table_info(pois)")
@@ -519,7 +545,7 @@ class DatabaseManager:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM sharp_turns WHERE route_id = ?", (route_id,))
+                cursor.execute("SELECT * FROM sharp_turns WHERE route_id = ? ORDER BY id", (route_id,))
                 return [dict(row) for row in cursor.fetchall()]
         except Exception as e:
             print(f"Error getting sharp turns: {e}")
@@ -556,7 +582,7 @@ class DatabaseManager:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM network_coverage WHERE route_id = ?", (route_id,))
+                cursor.execute("SELECT * FROM network_coverage WHERE route_id = ? ORDER BY id", (route_id,))
                 return [dict(row) for row in cursor.fetchall()]
         except Exception as e:
             print(f"Error getting network coverage: {e}")
@@ -884,6 +910,49 @@ class DatabaseManager:
             print(f"Error getting route terrain: {e}")
             return None
 
+    def get_cached_traffic_data(self, route_id: str, max_age_seconds: int = 3600) -> Optional[Dict]:
+        """Get cached traffic analysis if it is younger than max_age_seconds"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cutoff = datetime.datetime.now().timestamp() - max_age_seconds
+                cursor.execute("""
+                    SELECT json FROM traffic_cache 
+                    WHERE route_id = ? AND fetched_at > ?
+                """, (route_id, cutoff))
+                row = cursor.fetchone()
+                return json.loads(row[0]) if row else None
+        except Exception as e:
+            print(f"Error getting cached traffic data: {e}")
+            return None
+    
+    def store_traffic_cache(self, route_id: str, traffic_data: Dict) -> bool:
+        """Store aggregated traffic analysis in the traffic cache"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT OR REPLACE INTO traffic_cache (route_id, fetched_at, json)
+                    VALUES (?, ?, ?)
+                """, (route_id, datetime.datetime.now().timestamp(), json.dumps(traffic_data)))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"Error storing traffic cache: {e}")
+            return False
+    
+    def clear_traffic_cache(self, route_id: str) -> bool:
+        """Drop the cached traffic analysis of a route whose traffic data changed"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM traffic_cache WHERE route_id = ?", (route_id,))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"Error clearing traffic cache: {e}")
+            return False
+    
     def get_enhanced_route_overview_data(self, route_id: str) -> Dict[str, Any]:
         """Get all data needed for enhanced route overview"""
         try:
@@ -1050,7 +1119,7 @@ class DatabaseManager:
                 with sqlite3.connect(self.db_path) as conn:
                     conn.row_factory = sqlite3.Row
                     cursor = conn.cursor()
-                    cursor.execute("SELECT * FROM traffic_data WHERE route_id = ?", (route_id,))
+                    cursor.execute("SELECT * FROM traffic_data WHERE route_id = ? ORDER BY id", (route_id,))
                     result['traffic_data'] = [dict(row) for row in cursor.fetchall()]
             except Exception as e:
                 print(f"Error getting traffic data: {e}")
@@ -1120,6 +1189,7 @@ class DatabaseManager:
                     cursor.execute("""
                         SELECT * FROM traffic_data 
                         WHERE route_id = ? AND congestion_level IN ('HEAVY', 'MODERATE')
+                        ORDER BY id
                     """, (route_id,))
                     traffic_incidents = []
                     for row in cursor.fetchall():
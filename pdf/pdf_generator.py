@@ -1,50 +1,399 @@
 # pdf/pdf_generator.py - Complete Full PDF Generator with Unicode Fixes
 # Purpose: Generate comprehensive PDF reports using database data and stored images
-# Dependencies: fpdf2, PIL, sqlite3, os, matplotlib
+# Dependencies: fpdf2, PIL, sqlite3, os, matplotlib (lazily imported)
 # Author: Route Analysis System - Complete Version with Unicode Handling
 # Created: 2024
 
 import os
 import datetime
 import json
+import math
+import bisect
+import functools
+import hashlib
+import itertools
+import re
 import sqlite3
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import requests
+from typing import Dict, List, Any, Optional, Tuple
 from io import BytesIO
+from operator import itemgetter
+from api.route_api import RouteAPI
+# Heavier dependencies (matplotlib, PIL, requests) are imported where they are used
 try:
     from fpdf import FPDF
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as mpatches
-    from PIL import Image
-    import tempfile
-    import numpy as np
+    from fpdf.enums import MethodReturnValue
+    from fpdf.drawing import DeviceGray, DeviceRGB
 except ImportError as e:
     print(f"Warning: PDF dependencies not fully available: {e}")
-    print("Install with: pip install fpdf2 matplotlib pillow numpy")
+    print("Install with: pip install fpdf2 matplotlib pillow")
+
+# Unicode replacements with PDF-safe (ASCII) alternatives
+_UNICODE_REPLACEMENTS = {
+    # Icons and symbols - CRITICAL FIXES
+    '✅': '[OK]',     # Check mark
+    '✓': '[OK]',     # Checkmark
+    '✗': '[X]',      # X mark
+    '⚠': '[!]',      # Warning symbol
+    '📄': '',        # Page icon
+    '📋': '',        # Clipboard
+    '📁': '',        # Folder
+    '📸': '',        # Camera
+    '📊': '',        # Chart
+    '❌': '[ERROR]', # Red X
+    '⛔': '[STOP]',  # Stop sign
+
+    # Mathematical symbols
+    '≥': '>=',      # Greater than or equal to
+    '≤': '<=',      # Less than or equal to
+    '°': ' deg',    # Degree symbol - CRITICAL FIX
+    '→': '->',      # Right arrow
+    '←': '<-',      # Left arrow
+    '↑': '^',       # Up arrow
+    '↓': 'v',       # Down arrow
+    '•': '*',       # Bullet point
+    '–': '-',       # En dash
+    '—': '--',      # Em dash
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+    '\u2018': "'",  # Left single quote
+    '\u2019': "'",  # Right single quote
+    '\u00a0': ' ',  # Non-breaking space
+    '…': '...',     # Ellipsis
+    '×': 'x',       # Multiplication sign
+    '÷': '/',       # Division sign
+    '±': '+/-',     # Plus-minus sign
+    '√': 'sqrt',    # Square root
+    '∞': 'infinity', # Infinity
+    '∑': 'sum',     # Summation
+    '∆': 'delta',   # Delta
+    '∇': 'nabla',   # Nabla
+    '∂': 'd',       # Partial derivative
+    '∫': 'integral', # Integral
+    '∏': 'product', # Product
+    '∪': 'union',   # Union
+    '∩': 'intersection', # Intersection
+    '∈': 'in',      # Element of
+    '∉': 'not in',  # Not element of
+    '⊂': 'subset',  # Subset
+    '⊃': 'superset', # Superset
+    '⊆': 'subset or equal', # Subset or equal
+    '⊇': 'superset or equal', # Superset or equal
+    '∀': 'for all', # For all
+    '∃': 'exists',  # There exists
+    '∄': 'not exists', # Does not exist
+    '∧': 'and',     # Logical and
+    '∨': 'or',      # Logical or
+    '¬': 'not',     # Logical not
+    '⇒': '=>',      # Implies
+    '⇔': '<=>',     # If and only if
+    '≠': '!=',      # Not equal
+    '≈': '~=',      # Approximately equal
+    '≡': '===',     # Identical to
+    '∝': 'proportional to', # Proportional to
+    '∼': '~',       # Similar to
+    '∠': 'angle',   # Angle
+    '⊥': 'perpendicular', # Perpendicular
+    '∥': 'parallel', # Parallel
+    '⊙': 'circle dot', # Circle with dot
+    '⊕': 'circle plus', # Circle with plus
+    '⊗': 'circle times', # Circle with times
+    '⊘': 'circle slash', # Circle with slash
+
+    # Currency and special characters
+    '℃': 'C',       # Celsius
+    '℉': 'F',       # Fahrenheit
+    '€': 'EUR',     # Euro
+    '£': 'GBP',     # Pound
+    '¥': 'JPY',     # Yen
+    '₹': 'INR',     # Indian Rupee
+    '©': '(c)',     # Copyright
+    '®': '(R)',     # Registered trademark
+    '™': '(TM)',    # Trademark
+    '§': 'section', # Section sign
+    '¶': 'paragraph', # Paragraph sign
+    '†': '+',       # Dagger
+    '‡': '++',      # Double dagger
+    '‰': 'per mille', # Per mille
+    '‱': 'per ten thousand', # Per ten thousand
+    '′': "'",       # Prime
+    '″': '"',       # Double prime
+    '‴': "'''",     # Triple prime
+    '※': 'note',    # Reference mark
+    '‼': '!!',      # Double exclamation
+    '⁇': '??',      # Double question
+    '⁈': '?!',      # Question exclamation
+    '⁉': '!?',      # Exclamation question
+
+    # Superscripts and subscripts
+    '⁰': '^0', '¹': '^1', '²': '^2', '³': '^3', '⁴': '^4',
+    '⁵': '^5', '⁶': '^6', '⁷': '^7', '⁸': '^8', '⁹': '^9',
+    '₀': '_0', '₁': '_1', '₂': '_2', '₃': '_3', '₄': '_4',
+    '₅': '_5', '₆': '_6', '₇': '_7', '₈': '_8', '₉': '_9',
+
+    # Greek letters (common ones)
+    'α': 'alpha', 'β': 'beta', 'γ': 'gamma', 'δ': 'delta',
+    'ε': 'epsilon', 'ζ': 'zeta', 'η': 'eta', 'θ': 'theta',
+    'ι': 'iota', 'κ': 'kappa', 'λ': 'lambda', 'μ': 'mu',
+    'ν': 'nu', 'ξ': 'xi', 'ο': 'omicron', 'π': 'pi',
+    'ρ': 'rho', 'σ': 'sigma', 'τ': 'tau', 'υ': 'upsilon',
+    'φ': 'phi', 'χ': 'chi', 'ψ': 'psi', 'ω': 'omega',
+    'Α': 'Alpha', 'Β': 'Beta', 'Γ': 'Gamma', 'Δ': 'Delta',
+    'Ε': 'Epsilon', 'Ζ': 'Zeta', 'Η': 'Eta', 'Θ': 'Theta',
+    'Ι': 'Iota', 'Κ': 'Kappa', 'Λ': 'Lambda', 'Μ': 'Mu',
+    'Ν': 'Nu', 'Ξ': 'Xi', 'Ο': 'Omicron', 'Π': 'Pi',
+    'Ρ': 'Rho', 'Σ': 'Sigma', 'Τ': 'Tau', 'Υ': 'Upsilon',
+    'Φ': 'Phi', 'Χ': 'Chi', 'Ψ': 'Psi', 'Ω': 'Omega'
+}
+
+# Single C-level pass over the text instead of one str.replace per entry
+_XLATE = str.maketrans(_UNICODE_REPLACEMENTS)
+
+# Multi-codepoint sequences that a 1:1 translate table cannot express, e.g. '⚠️'
+# (symbol + U+FE0F emoji presentation selector, which would otherwise leave a '?')
+_MULTI_CHAR_REPLACEMENTS = {char + '\ufe0f': replacement for char, replacement in _UNICODE_REPLACEMENTS.items()}
+_MULTI_CHAR_PATTERN = re.compile('|'.join(
+    re.escape(seq) for seq in sorted(_MULTI_CHAR_REPLACEMENTS, key=len, reverse=True)))
+
+@functools.lru_cache(maxsize=8192)
+def _clean(text: str) -> str:
+    """Clean text for FPDF core fonts (cached, pure ASCII returned as-is)"""
+    if text.isascii():
+        return text
+    # Multi-codepoint sequences first, then single characters; anything
+    # non-ASCII that remains becomes '?'
+    cleaned_text = _MULTI_CHAR_PATTERN.sub(lambda m: _MULTI_CHAR_REPLACEMENTS[m.group(0)], text)
+    return cleaned_text.translate(_XLATE).encode('ascii', 'replace').decode('ascii')
+
+@functools.lru_cache(maxsize=8192)
+def _clean_for_glyphs(text: str, glyphs: frozenset) -> str:
+    """Clean text for a Unicode TTF font, replacing only characters it has no glyph for"""
+    if text.isascii():
+        return text
+    text = _MULTI_CHAR_PATTERN.sub(
+        lambda m: m.group(0) if all(ord(c) in glyphs for c in m.group(0)) else _MULTI_CHAR_REPLACEMENTS[m.group(0)],
+        text)
+    return ''.join(c if ord(c) in glyphs else _clean(c) for c in text)
+
+# Duration ("2 hours 30 mins") and distance ("1,234.5 km") parsing
+_HOUR_RE = re.compile(r'(\d+)\s*(?:hours?|hrs?|h)')
+_MIN_RE = re.compile(r'(\d+)\s*(?:minutes?|mins?|m)')
+_NUM_RE = re.compile(r'(\d+)')
+_KM_RE = re.compile(r'([\d,\.]+)\s*k')
+_MILE_RE = re.compile(r'([\d,\.]+)\s*m')
+_DECIMAL_RE = re.compile(r'([\d,\.]+)')
+
+# Sort order of risk levels within a priority band (risk zone tables)
+_RISK_RANK = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+
+# Static map zoom by route extent in degrees: spans up to _ZOOM_THRESHOLDS[i]
+# get _ZOOM_LEVELS[i], anything wider the last level
+_ZOOM_THRESHOLDS = [0.05, 0.1, 0.2, 0.5]
+_ZOOM_LEVELS = [13, 12, 11, 10, 9]
+
+# DejaVu Sans files for the optional Unicode font (PDF_UNICODE_FONT=true),
+# looked up in static/fonts first and then in the copy bundled with matplotlib
+_UNICODE_FONT_FILES = {
+    '': 'DejaVuSans.ttf',
+    'B': 'DejaVuSans-Bold.ttf',
+    'I': 'DejaVuSans-Oblique.ttf',
+    'BI': 'DejaVuSans-BoldOblique.ttf',
+}
+
+def _rowget(row, key: str, default=None):
+    """dict.get() for sqlite3.Row results, which have no get()"""
+    try:
+        return row[key]
+    except (IndexError, KeyError):
+        return default
+
+@functools.lru_cache(maxsize=128)
+def _pretty_api_name(api_name: str) -> str:
+    """Format api_usage names for display (google_maps -> Google Maps)"""
+    return api_name.replace('_', ' ').title()
 
 class PDFGenerator:
     """Complete comprehensive PDF generator with Unicode handling"""
     
+    # API status tiers - bisect_right over thresholds picks the tier (value >= threshold)
+    _API_PERFORMANCE_THRESHOLDS = (50, 75, 90)
+    _API_PERFORMANCE_TIERS = (
+        ('danger_color', 'POOR API PERFORMANCE'),
+        ('warning_color', 'MODERATE API PERFORMANCE'),
+        ('info_color', 'GOOD API PERFORMANCE'),
+        ('success_color', 'EXCELLENT API PERFORMANCE')
+    )
+    _API_STATUS_THRESHOLDS = (50, 80)
+    _API_STATUS_LABELS = ('Failed', 'Issues', 'Working')
+    
+    # Title page header lines: (text, font style, size, y, cell height)
+    _TITLE_HEADER_WITH_LOGO = (
+        ('HINDUSTAN PETROLEUM CORPORATION LIMITED', 'B', 20, 20, 12),
+        ('Journey Risk Management Division', '', 12, 35, 8),
+        ('Powered by Route Analytics Pro - AI Intelligence Platform', 'I', 10, 50, 6),
+    )
+    _TITLE_HEADER_TEXT_ONLY = (
+        ('HINDUSTAN PETROLEUM CORPORATION LIMITED', 'B', 26, 25, 15),
+        ('Journey Risk Management Division', '', 14, 45, 8),
+        ('Powered by Route Analytics Pro - AI Intelligence Platform', 'I', 10, 55, 6),
+    )
+    
+    # Longest origin/destination address shown in a table cell
+    _ADDRESS_LIMIT = 50
+    
+    # Logo file contents by path, read once per process and shared by every report
+    _LOGO_CACHE: Dict[str, bytes] = {}
+    
+    # Downloaded static maps kept on disk in images/map_cache (keyed by URL hash)
+    _MAP_CACHE_LIMIT = 200
+    
+    # Map legend markers and their meaning, shown in two columns
+    _MAP_LEGEND_ITEMS = (
+        ('A', 'Route Start Point'),
+        ('B', 'Route End Point'),
+        ('T#', 'Critical Sharp Turns'),
+        ('H', 'Hospitals'),
+        ('P', 'Police Stations'),
+        ('F', 'Fire Stations'),
+        ('G', 'Gas Stations'),
+        ('S', 'Schools/Education'),
+        ('*', 'Highway Junctions'),
+    )
+    
+    # Season of each month, January first
+    _MONTH_TO_SEASON = ('Winter',) * 2 + ('Summer',) * 3 + ('Monsoon',) * 4 + ('Post-Monsoon',) * 2 + ('Winter',)
+    
+    # Row source of the seasonal conditions query -> name of its value column
+    _SEASONAL_VALUE_FIELDS = {'traffic': 'current_speed', 'elevation': 'elevation', 'school': 'name'}
+    # Row source -> (table, SELECT of its rows); the branches are combined with UNION ALL
+    _SEASONAL_QUERIES = {
+        'traffic': ('traffic_data', """
+            SELECT 'traffic', latitude, longitude, current_speed
+            FROM traffic_data
+            WHERE route_id = ? AND congestion_level = 'HEAVY'
+            ORDER BY id
+            LIMIT 3"""),
+        'elevation': ('elevation_data', """
+            SELECT 'elevation', latitude, longitude, elevation
+            FROM elevation_data
+            WHERE route_id = ?
+            ORDER BY elevation DESC
+            LIMIT 3"""),
+        'school': ('pois', """
+            SELECT 'school', latitude, longitude, name
+            FROM pois
+            WHERE route_id = ? AND poi_type = 'school'
+            ORDER BY id
+            LIMIT 3"""),
+    }
+    
+    # Confidence levels seen across road quality rows, OR-ed into one bitmask
+    _CONFIDENCE_BITS = {'high': 1, 'medium': 2, 'low': 4}
+    _SYSTEM_RECOMMENDATIONS_TEXT = '\n'.join([
+        "* Monitor API response times to ensure optimal performance",
+        "* Implement retry mechanisms for failed API calls",
+        "* Cache frequently requested data to reduce API usage",
+        "* Set up monitoring alerts for API failures or slowdowns",
+        "* Consider backup API providers for critical services",
+        "* Regularly review API usage against rate limits and costs"
+    ])
+    
     def __init__(self, db_manager,api_tracker=None):
         self.db_manager = db_manager
         self.api_tracker = api_tracker
     
         # Initialize route_api for enhanced features
         if api_tracker:
-            from api.route_api import RouteAPI
             self.route_api = RouteAPI(db_manager, api_tracker)
             print("📄 PDF Generator initialized with enhanced route overview support")
         else:
             self.route_api = None
             print("📄 PDF Generator initialized in basic mode")
         
+        # Untracked RouteAPI shared by all page builders
+        self.page_route_api = RouteAPI(db_manager, None)
+        
+        # Per-thread state of the report being generated (SQLite connection,
+        # prefetched page data, skipped-page errors, cached rows and string
+        # widths); one generator serves concurrent requests
+        self._local = threading.local()
+        
+        # Tables probed once at startup; optional tables created later are
+        # picked up by _table_exists on first use
+        self._known_tables = set()
+        try:
+            with self._conn() as conn:
+                self._known_tables.update(
+                    row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'"))
+        except Exception as e:
+            print(f"Warning: could not list database tables: {e}")
+        
         # Image directories
         self.image_base_path = "images"
         self.maps_path = os.path.join(self.image_base_path, "maps")
         self.satellite_path = os.path.join(self.image_base_path, "satellite")
         self.street_view_path = os.path.join(self.image_base_path, "street_view")
+        self.thumbs_path = os.path.join(self.image_base_path, "thumbs")
+        self.map_cache_path = os.path.join(self.image_base_path, "map_cache")
+        
+        # Output directory for generated reports, created once per generator
+        self.reports_dir = 'reports'
+        os.makedirs(self.reports_dir, exist_ok=True)
+        
+        # Opt-in Unicode TTF font instead of ASCII-cleaned Helvetica text
+        self.unicode_font = os.environ.get('PDF_UNICODE_FONT', '').lower() in ('1', 'true', 'yes')
+        
+        # Opt-in: pages whose data call failed are listed on one closing page
+        # instead of each rendering a page of its own
+        self.collapse_error_pages = os.environ.get('PDF_COLLAPSE_ERROR_PAGES', '').lower() in ('1', 'true', 'yes')
+        
+        # Static map downloads share one keep-alive HTTP session (created on first
+        # download); each report runs its download on its own executor
+        self._http = None
+        self._http_lock = threading.Lock()
+        
+        # Data sources of the pages; generate_route_pdf runs them concurrently
+        # before rendering (they must not touch the PDF)
+        self._page_fetchers = {
+            'overview': self._fetch_overview_data,
+            'turns': self.get_turns_with_images,
+            'pois': self.page_route_api.get_points_of_interest,
+            'network': self.page_route_api.get_network_coverage,
+            'weather': self.page_route_api.get_weather_data,
+            'compliance': self.page_route_api.get_compliance_data,
+            'elevation': self.page_route_api.get_elevation_data,
+            'emergency': self._fetch_emergency_data,
+            'route_map': lambda route_id: self.get_stored_images_from_db(route_id, 'route_map'),
+            'images_summary': self.get_stored_images_from_db,
+            'traffic': self._fetch_traffic_data,
+            'road_quality': self._get_road_quality_data_from_db,
+            'environmental': self._get_environmental_data_from_db,
+        }
         
+        # Page renderers, each called as builder(pdf, route_id)
+        self._page_builders = {
+            'title': lambda pdf, route_id: self._add_title_page(pdf, self._get_route(route_id)),
+            'overview': self._add_overview_page,
+            'turns': self._add_enhanced_turns_page,
+            'pois': self._add_pois_page,
+            'network': self._add_network_page,
+            'weather': self._add_weather_page,
+            'compliance': self._add_compliance_page,
+            'elevation': self._add_elevation_page,
+            'emergency': self._add_emergency_page,
+            'route_map': self._add_route_map_page,
+            'images_summary': self._add_images_summary_page,
+            'traffic': self._add_traffic_page,
+            'road_quality': self._add_road_quality_page,
+            'environmental': self._add_environmental_page,
+            'api_status': self._add_api_status_page,
+        }
+
         # HPCL color scheme
         self.primary_color = (0, 82, 147)      # HPCL Blue
         self.secondary_color = (60, 60, 60)    # Dark Gray
@@ -76,154 +425,77 @@ class PDFGenerator:
         print(f"📁 Images directory: {self.image_base_path}")
         self._verify_image_directories()
 
-    def clean_text_for_pdf(self, text: str) -> str:
+    @staticmethod
+    def clean_text_for_pdf(text: str) -> str:
         """
         Clean text to remove Unicode characters that FPDF can't handle
         """
-        # Dictionary of Unicode replacements with PDF-safe alternatives
-        unicode_replacements = {
-            # Icons and symbols - CRITICAL FIXES
-            '✅': '[OK]',     # Check mark
-            '✓': '[OK]',     # Checkmark
-            '✗': '[X]',      # X mark
-            '⚠': '[!]',      # Warning symbol
-            '📄': '',        # Page icon
-            '📋': '',        # Clipboard
-            '📁': '',        # Folder
-            '📸': '',        # Camera
-            '📊': '',        # Chart
-            '❌': '[ERROR]', # Red X
-            '⛔': '[STOP]',  # Stop sign
-            
-            # Mathematical symbols
-            '≥': '>=',      # Greater than or equal to
-            '≤': '<=',      # Less than or equal to
-            '°': ' deg',    # Degree symbol - CRITICAL FIX
-            '→': '->',      # Right arrow
-            '←': '<-',      # Left arrow
-            '↑': '^',       # Up arrow
-            '↓': 'v',       # Down arrow
-            '•': '*',       # Bullet point
-            '–': '-',       # En dash
-            '—': '--',      # Em dash
-            '"': '"',       # Left double quote
-            '"': '"',       # Right double quote
-            ''': "'",       # Left single quote
-            ''': "'",       # Right single quote
-            '…': '...',     # Ellipsis
-            '×': 'x',       # Multiplication sign
-            '÷': '/',       # Division sign
-            '±': '+/-',     # Plus-minus sign
-            '√': 'sqrt',    # Square root
-            '∞': 'infinity', # Infinity
-            '∑': 'sum',     # Summation
-            '∆': 'delta',   # Delta
-            '∇': 'nabla',   # Nabla
-            '∂': 'd',       # Partial derivative
-            '∫': 'integral', # Integral
-            '∏': 'product', # Product
-            '∪': 'union',   # Union
-            '∩': 'intersection', # Intersection
-            '∈': 'in',      # Element of
-            '∉': 'not in',  # Not element of
-            '⊂': 'subset',  # Subset
-            '⊃': 'superset', # Superset
-            '⊆': 'subset or equal', # Subset or equal
-            '⊇': 'superset or equal', # Superset or equal
-            '∀': 'for all', # For all
-            '∃': 'exists',  # There exists
-            '∄': 'not exists', # Does not exist
-            '∧': 'and',     # Logical and
-            '∨': 'or',      # Logical or
-            '¬': 'not',     # Logical not
-            '⇒': '=>',      # Implies
-            '⇔': '<=>',     # If and only if
-            '≠': '!=',      # Not equal
-            '≈': '~=',      # Approximately equal
-            '≡': '===',     # Identical to
-            '∝': 'proportional to', # Proportional to
-            '∼': '~',       # Similar to
-            '∠': 'angle',   # Angle
-            '⊥': 'perpendicular', # Perpendicular
-            '∥': 'parallel', # Parallel
-            '⊙': 'circle dot', # Circle with dot
-            '⊕': 'circle plus', # Circle with plus
-            '⊗': 'circle times', # Circle with times
-            '⊘': 'circle slash', # Circle with slash
-            
-            # Currency and special characters
-            '℃': 'C',       # Celsius
-            '℉': 'F',       # Fahrenheit
-            '€': 'EUR',     # Euro
-            '£': 'GBP',     # Pound
-            '¥': 'JPY',     # Yen
-            '₹': 'INR',     # Indian Rupee
-            '©': '(c)',     # Copyright
-            '®': '(R)',     # Registered trademark
-            '™': '(TM)',    # Trademark
-            '§': 'section', # Section sign
-            '¶': 'paragraph', # Paragraph sign
-            '†': '+',       # Dagger
-            '‡': '++',      # Double dagger
-            '‰': 'per mille', # Per mille
-            '‱': 'per ten thousand', # Per ten thousand
-            '′': "'",       # Prime
-            '″': '"',       # Double prime
-            '‴': "'''",     # Triple prime
-            '※': 'note',    # Reference mark
-            '‼': '!!',      # Double exclamation
-            '⁇': '??',      # Double question
-            '⁈': '?!',      # Question exclamation
-            '⁉': '!?',      # Exclamation question
-            
-            # Superscripts and subscripts
-            '⁰': '^0', '¹': '^1', '²': '^2', '³': '^3', '⁴': '^4',
-            '⁵': '^5', '⁶': '^6', '⁷': '^7', '⁸': '^8', '⁹': '^9',
-            '₀': '_0', '₁': '_1', '₂': '_2', '₃': '_3', '₄': '_4',
-            '₅': '_5', '₆': '_6', '₇': '_7', '₈': '_8', '₉': '_9',
-            
-            # Greek letters (common ones)
-            'α': 'alpha', 'β': 'beta', 'γ': 'gamma', 'δ': 'delta',
-            'ε': 'epsilon', 'ζ': 'zeta', 'η': 'eta', 'θ': 'theta',
-            'ι': 'iota', 'κ': 'kappa', 'λ': 'lambda', 'μ': 'mu',
-            'ν': 'nu', 'ξ': 'xi', 'ο': 'omicron', 'π': 'pi',
-            'ρ': 'rho', 'σ': 'sigma', 'τ': 'tau', 'υ': 'upsilon',
-            'φ': 'phi', 'χ': 'chi', 'ψ': 'psi', 'ω': 'omega',
-            'Α': 'Alpha', 'Β': 'Beta', 'Γ': 'Gamma', 'Δ': 'Delta',
-            'Ε': 'Epsilon', 'Ζ': 'Zeta', 'Η': 'Eta', 'Θ': 'Theta',
-            'Ι': 'Iota', 'Κ': 'Kappa', 'Λ': 'Lambda', 'Μ': 'Mu',
-            'Ν': 'Nu', 'Ξ': 'Xi', 'Ο': 'Omicron', 'Π': 'Pi',
-            'Ρ': 'Rho', 'Σ': 'Sigma', 'Τ': 'Tau', 'Υ': 'Upsilon',
-            'Φ': 'Phi', 'Χ': 'Chi', 'Ψ': 'Psi', 'Ω': 'Omega'
-        }
-        
-        # Apply replacements
-        cleaned_text = str(text)
-        for unicode_char, replacement in unicode_replacements.items():
-            cleaned_text = cleaned_text.replace(unicode_char, replacement)
-        
-        # Remove any remaining non-ASCII characters
-        cleaned_text = ''.join(char if ord(char) < 128 else '?' for char in cleaned_text)
-        
-        return cleaned_text
+        return _clean(str(text))
+
+    @staticmethod
+    def _list_files(dir_path: str) -> set:
+        """Names of regular files in a directory from a single scandir (empty if missing)"""
+        try:
+            with os.scandir(dir_path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
 
     def _verify_image_directories(self):
         """Verify and create image directories"""
         directories = [self.maps_path, self.satellite_path, self.street_view_path]
         for dir_path in directories:
             if os.path.exists(dir_path):
-                image_count = len([f for f in os.listdir(dir_path) if f.lower().endswith(('.jpg', '.jpeg', '.png'))])
+                image_count = sum(1 for name in self._list_files(dir_path)
+                                  if name.lower().endswith(('.jpg', '.jpeg', '.png')))
                 print(f"Found {image_count} images in {dir_path}")
             else:
                 print(f"Directory not found - creating: {dir_path}")
                 os.makedirs(dir_path, exist_ok=True)
                 print(f"Created directory: {dir_path}")
     
+    @contextmanager
+    def _conn(self):
+        """SQLite connection for page queries, shared by all queries of one report"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+        
+        conn = sqlite3.connect(self.db_manager.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            conn.close()
+
+    def _table_exists(self, conn, table_name: str) -> bool:
+        """Check table existence, querying sqlite_master only for tables not yet seen"""
+        if table_name in self._known_tables:
+            return True
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,)).fetchone():
+            self._known_tables.add(table_name)
+            return True
+        return False
+
+    @staticmethod
+    def _iter_rows(cursor, size: int = 1000):
+        """Yield sqlite3.Row results of an executed query, fetching size rows at a time"""
+        cursor.arraysize = size
+        while True:
+            batch = cursor.fetchmany(size)
+            if not batch:
+                break
+            yield from batch
+
     def get_stored_images_from_db(self, route_id: str, image_type: str = None) -> List[Dict]:
         """Get stored images information from database"""
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 if image_type:
@@ -239,28 +511,67 @@ class PDFGenerator:
                         ORDER BY image_type, created_at
                     """, (route_id,))
                 
-                return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in self._iter_rows(cursor)]
         except Exception as e:
             print(f"Error getting stored images from DB: {e}")
             return []
+
+    def _prepare_image_for_embed(self, image_path: str, max_size: tuple = (1120, 765)) -> str:
+        """Downscale image to ~150 DPI JPEG before embedding (cached in images/thumbs)"""
+        try:
+            from PIL import Image
+            stat = os.stat(image_path)
+            base_name = os.path.splitext(os.path.basename(image_path))[0]
+            # Same-named images in different directories get different thumbnails
+            path_hash = hashlib.sha1(os.path.abspath(image_path).encode()).hexdigest()[:12]
+            thumb_name = (f"{base_name}_{path_hash}_{int(stat.st_mtime)}_{stat.st_size}"
+                          f"_{max_size[0]}x{max_size[1]}.jpg")
+            thumb_path = os.path.join(self.thumbs_path, thumb_name)
+
+            if os.path.exists(thumb_path):
+                return thumb_path
+
+            os.makedirs(self.thumbs_path, exist_ok=True)
+            with Image.open(image_path) as im:
+                im.thumbnail(max_size, Image.LANCZOS)
+                if im.mode != 'RGB':
+                    im = im.convert('RGB')
+                buf = BytesIO()
+                im.save(buf, 'JPEG', quality=85)
+
+            # Written to a partial file and renamed into place, so a concurrent
+            # report never reads a half-written thumbnail
+            with tempfile.NamedTemporaryFile(dir=self.thumbs_path, delete=False, suffix='.part') as temp_file:
+                temp_file.write(buf.getvalue())
+            try:
+                os.replace(temp_file.name, thumb_path)
+            except OSError:
+                os.unlink(temp_file.name)
+                raise
+            return thumb_path
+        except Exception as e:
+            print(f"Error preparing image for PDF, embedding original: {e}")
+            return image_path
+
     def _add_road_quality_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add comprehensive road quality analysis page with real API data"""
         pdf.add_page()
         pdf.add_section_header("COMPREHENSIVE ROAD QUALITY & SURFACE CONDITIONS", "warning")
         
         # Get road quality data from database
-        road_quality_data = self._get_road_quality_data_from_db(route_id)
+        road_quality_data = self._page_data('road_quality', route_id)
         
         if road_quality_data and road_quality_data.get('issues'):
             issues = road_quality_data['issues']
+            severity_counts = road_quality_data.get('severity_counts', Counter())
             
             # Road Quality Summary Statistics
             summary_table = [
                 ['Total Analysis Points', f"{road_quality_data.get('total_points', 0):,}"],
                 ['Road Quality Issues Detected', f"{len(issues):,}"],
-                ['Critical Condition Areas', f"{len([i for i in issues if i.get('severity') == 'critical']):,}"],
-                ['High Risk Areas', f"{len([i for i in issues if i.get('severity') == 'high']):,}"],
-                ['Medium Risk Areas', f"{len([i for i in issues if i.get('severity') == 'medium']):,}"],
+                ['Critical Condition Areas', f"{severity_counts['critical']:,}"],
+                ['High Risk Areas', f"{severity_counts['high']:,}"],
+                ['Medium Risk Areas', f"{severity_counts['medium']:,}"],
                 ['API Sources Used', road_quality_data.get('api_sources', 'Multiple APIs')],
                 ['Analysis Confidence', road_quality_data.get('overall_confidence', 'High')],
                 ['Overall Road Quality Score', f"{road_quality_data.get('overall_score', 7.5):.1f}/10"]
@@ -293,7 +604,6 @@ class PDFGenerator:
             
             # Detailed Road Quality Issues
             pdf.ln(15)
-            pdf.set_text_color(0, 0, 0)
             pdf.set_font('Helvetica', 'B', 12)
             pdf.set_text_color(*self.danger_color)
             pdf.cell(0, 8, f'IDENTIFIED ROAD QUALITY ISSUES ({len(issues)} locations)', 0, 1, 'L')
@@ -306,11 +616,11 @@ class PDFGenerator:
             
             for issue in issues[:10]:  # Limit to 10 issues
                 row_data = [
-                    f"{issue.get('latitude', 0):.4f}, {issue.get('longitude', 0):.4f}",
-                    issue.get('issue_type', 'Unknown').replace('_', ' ').title(),
-                    issue.get('severity', 'Medium').title(),
-                    f"{issue.get('recommended_speed', 40)} km/h",
-                    issue.get('description', 'Road quality concern')[:40] + '...' if len(issue.get('description', '')) > 40 else issue.get('description', 'Road quality concern')
+                    f"{_rowget(issue, 'latitude', 0):.4f}, {_rowget(issue, 'longitude', 0):.4f}",
+                    _rowget(issue, 'issue_type', 'Unknown').replace('_', ' ').title(),
+                    _rowget(issue, 'severity', 'Medium').title(),
+                    f"{_rowget(issue, 'recommended_speed', 40)} km/h",
+                    self._ellipsize(_rowget(issue, 'description'), 'Road quality concern')
                 ]
                 pdf.create_table_row(row_data, col_widths)
             
@@ -361,7 +671,7 @@ class PDFGenerator:
         pdf.add_section_header("COMPREHENSIVE ENVIRONMENTAL RISK ASSESSMENT", "success")
         
         # Get environmental data from database
-        environmental_data = self._get_environmental_data_from_db(route_id)
+        environmental_data = self._page_data('environmental', route_id)
         
         if environmental_data and environmental_data.get('has_risks'):
             risks = environmental_data['risks']
@@ -409,7 +719,6 @@ class PDFGenerator:
             # Show environmental risks
             if risks:
                 pdf.ln(5)
-                pdf.set_text_color(0, 0, 0)
                 pdf.set_font('Helvetica', 'B', 12)
                 pdf.set_text_color(*self.success_color)
                 pdf.cell(0, 8, f'ENVIRONMENTAL RISKS IDENTIFIED ({len(risks)} locations)', 0, 1, 'L')
@@ -421,11 +730,11 @@ class PDFGenerator:
                 
                 for risk in risks[:10]:  # Limit to 10 risks
                     row_data = [
-                        risk.get('risk_type', 'Unknown').replace('_', ' ').title(),
-                        f"{risk.get('latitude', 0):.4f}, {risk.get('longitude', 0):.4f}",
-                        risk.get('severity', 'Medium').title(),
-                        risk.get('risk_category', 'General').title(),
-                        risk.get('description', 'Environmental risk')[:40] + '...' if len(risk.get('description', '')) > 40 else risk.get('description', 'Environmental risk')
+                        _rowget(risk, 'risk_type', 'Unknown').replace('_', ' ').title(),
+                        f"{_rowget(risk, 'latitude', 0):.4f}, {_rowget(risk, 'longitude', 0):.4f}",
+                        _rowget(risk, 'severity', 'Medium').title(),
+                        _rowget(risk, 'risk_category', 'General').title(),
+                        self._ellipsize(_rowget(risk, 'description'), 'Environmental risk')
                     ]
                     pdf.create_table_row(row_data, col_widths)
             
@@ -473,48 +782,52 @@ class PDFGenerator:
     def _get_road_quality_data_from_db(self, route_id: str) -> Dict:
         """Get road quality data from database"""
         try:
-            import sqlite3
-            
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 # Check if road quality table exists
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='road_quality_data'")
-                if not cursor.fetchone():
+                if not self._table_exists(conn, 'road_quality_data'):
                     return {'issues': [], 'total_points': 0}
                 
                 cursor.execute("SELECT * FROM road_quality_data WHERE route_id = ?", (route_id,))
-                issues = [dict(row) for row in cursor.fetchall()]
+                
+                # Collect issues and their statistics in one pass over the rows
+                severity_scores = {'critical': 2, 'high': 4, 'medium': 6, 'low': 8}
+                issues = []
+                severity_counts = Counter()
+                api_sources = set()
+                confidence_bits = 0
+                
+                for issue in self._iter_rows(cursor):
+                    issues.append(issue)
+                    severity_counts[_rowget(issue, 'severity', 'medium')] += 1
+                    if _rowget(issue, 'api_sources'):
+                        api_sources.update(issue['api_sources'].split(','))
+                    confidence_bits |= self._CONFIDENCE_BITS.get(_rowget(issue, 'confidence'), 0)
                 
                 if issues:
                     # Calculate overall statistics
                     total_points = len(issues)
-                    api_sources = set()
-                    confidence_levels = []
-                    
-                    for issue in issues:
-                        if issue.get('api_sources'):
-                            api_sources.update(issue['api_sources'].split(','))
-                        if issue.get('confidence'):
-                            confidence_levels.append(issue['confidence'])
                     
                     # Calculate overall confidence
-                    if 'high' in confidence_levels:
+                    if confidence_bits & self._CONFIDENCE_BITS['high']:
                         overall_confidence = 'High'
-                    elif 'medium' in confidence_levels:
+                    elif confidence_bits & self._CONFIDENCE_BITS['medium']:
                         overall_confidence = 'Medium'
                     else:
                         overall_confidence = 'Low'
                     
-                    # Calculate overall score (inverse of average severity)
-                    severity_scores = {'critical': 2, 'high': 4, 'medium': 6, 'low': 8}
-                    avg_severity_score = sum(severity_scores.get(issue.get('severity', 'medium'), 6) for issue in issues) / len(issues)
+                    # Calculate overall score (inverse of average severity), weighting
+                    # each severity's score by its count rather than scoring every issue
+                    avg_severity_score = sum(
+                        severity_scores.get(severity, 6) * count for severity, count in severity_counts.items()
+                    ) / total_points
                     overall_score = min(10, avg_severity_score)
                     
                     return {
                         'issues': issues,
                         'total_points': total_points,
+                        'severity_counts': severity_counts,
                         'api_sources': ', '.join(sorted(api_sources)),
                         'overall_confidence': overall_confidence,
                         'overall_score': overall_score
@@ -529,31 +842,29 @@ class PDFGenerator:
     def _get_environmental_data_from_db(self, route_id: str) -> Dict:
         """Get environmental data from database"""
         try:
-            import sqlite3
-            
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 # Check if environmental table exists
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='environmental_risks'")
-                if not cursor.fetchone():
+                if not self._table_exists(conn, 'environmental_risks'):
                     return {'has_risks': False, 'risks': []}
                 
-                cursor.execute("SELECT * FROM environmental_risks WHERE route_id = ?", (route_id,))
-                risks = [dict(row) for row in cursor.fetchall()]
+                cursor.execute("SELECT * FROM environmental_risks WHERE route_id = ? ORDER BY id", (route_id,))
+                
+                # Collect risks with category and severity counts in one pass
+                risks = []
+                risk_categories = Counter()
+                severity_counts = Counter()
+                for risk in self._iter_rows(cursor):
+                    risks.append(risk)
+                    risk_categories[_rowget(risk, 'risk_category', 'unknown')] += 1
+                    severity_counts[_rowget(risk, 'severity')] += 1
                 
                 if risks:
-                    # Calculate summary statistics
-                    risk_categories = {}
-                    for risk in risks:
-                        category = risk.get('risk_category', 'unknown')
-                        risk_categories[category] = risk_categories.get(category, 0) + 1
-                    
                     # Calculate environmental score
                     total_risks = len(risks)
-                    critical_risks = len([r for r in risks if r.get('severity') == 'critical'])
-                    high_risks = len([r for r in risks if r.get('severity') == 'high'])
+                    critical_risks = severity_counts['critical']
+                    high_risks = severity_counts['high']
                     
                     env_score = max(1, 10 - (critical_risks * 2) - (high_risks * 1))
                     
@@ -591,39 +902,47 @@ class PDFGenerator:
     def get_turns_with_images(self, route_id: str) -> List[Dict]:
         """Get sharp turns data with associated images from database"""
         try:
-            # Get sharp turns
-            sharp_turns = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            # One query: each turn joined with the street view / satellite images
+            # taken within ~100m (0.001 deg in both lat and lng)
+            turns = {}
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT * FROM sharp_turns 
-                    WHERE route_id = ? 
-                    ORDER BY angle DESC
+                    SELECT t.*,
+                           i.id AS i_id, i.route_id AS i_route_id, i.image_type AS i_image_type,
+                           i.latitude AS i_latitude, i.longitude AS i_longitude,
+                           i.filename AS i_filename, i.file_path AS i_file_path,
+                           i.file_size AS i_file_size, i.created_at AS i_created_at
+                    FROM sharp_turns t
+                    LEFT JOIN stored_images i
+                        ON i.route_id = t.route_id
+                        AND i.image_type IN ('street_view', 'satellite')
+                        AND i.latitude > t.latitude - 0.001 AND i.latitude < t.latitude + 0.001
+                        AND i.longitude > t.longitude - 0.001 AND i.longitude < t.longitude + 0.001
+                    WHERE t.route_id = ?
+                    ORDER BY t.angle DESC, t.id, i.image_type, i.created_at
                 """, (route_id,))
-                sharp_turns = [dict(row) for row in cursor.fetchall()]
-            
-            # Get all stored images for this route
-            all_images = self.get_stored_images_from_db(route_id)
-            
-            # Associate images with turns based on GPS proximity
-            for turn in sharp_turns:
-                turn['street_view_images'] = []
-                turn['satellite_images'] = []
                 
-                for img in all_images:
-                    if img['latitude'] and img['longitude']:
-                        # Check if image is close to turn location (within ~100m)
-                        lat_diff = abs(float(img['latitude']) - float(turn['latitude']))
-                        lng_diff = abs(float(img['longitude']) - float(turn['longitude']))
-                        
-                        if lat_diff < 0.001 and lng_diff < 0.001:  # Approximately 100m
-                            if img['image_type'] == 'street_view':
-                                turn['street_view_images'].append(img)
-                            elif img['image_type'] == 'satellite':
-                                turn['satellite_images'].append(img)
+                columns = [col[0] for col in cursor.description]
+                turn_columns = [col for col in columns if not col.startswith('i_')]
+                image_columns = [col for col in columns if col.startswith('i_')]
+                
+                for row in cursor:
+                    turn = turns.get(row['id'])
+                    if turn is None:
+                        turn = {col: row[col] for col in turn_columns}
+                        turn['street_view_images'] = []
+                        turn['satellite_images'] = []
+                        turns[row['id']] = turn
+                    
+                    if row['i_id'] is not None:
+                        img = {col[2:]: row[col] for col in image_columns}
+                        if img['image_type'] == 'street_view':
+                            turn['street_view_images'].append(img)
+                        else:
+                            turn['satellite_images'].append(img)
             
-            return sharp_turns
+            return list(turns.values())
             
         except Exception as e:
             print(f"Error getting turns with images: {e}")
@@ -632,8 +951,10 @@ class PDFGenerator:
     def generate_route_pdf(self, route_id: str, pages: str = 'all') -> Optional[str]:
         """Generate comprehensive PDF report"""
         try:
-            # Get route data
-            route = self.db_manager.get_route(route_id)
+            # Get route data (fresh for every report)
+            self._local.caches = {}
+            self._local.page_errors = []
+            route = self._get_route(route_id)
             if not route:
                 print(f"Route {route_id} not found")
                 return None
@@ -653,49 +974,39 @@ class PDFGenerator:
             print(f"Pages ({len(requested_pages)}): {', '.join(requested_pages)}")
             
             # Create PDF with Unicode-safe class
-            pdf = EnhancedRoutePDF(self)
-            
-            # Generate each requested page
-            for page_name in requested_pages:
-                print(f"   Generating {self.available_pages[page_name]}...")
-                
-                if page_name == 'title':
-                    self._add_title_page(pdf, route)
-                elif page_name == 'overview':
-                    self._add_overview_page(pdf, route_id)
-                elif page_name == 'turns':
-                    self._add_enhanced_turns_page(pdf, route_id)
-                elif page_name == 'pois':
-                    self._add_pois_page(pdf, route_id)
-                elif page_name == 'network':
-                    self._add_network_page(pdf, route_id)
-                elif page_name == 'weather':
-                    self._add_weather_page(pdf, route_id)
-                elif page_name == 'compliance':
-                    self._add_compliance_page(pdf, route_id)
-                elif page_name == 'elevation':
-                    self._add_elevation_page(pdf, route_id)
-                elif page_name == 'emergency':
-                    self._add_emergency_page(pdf, route_id)
-                elif page_name == 'route_map':
-                    self._add_route_map_page(pdf, route_id)
-                elif page_name == 'images_summary':
-                    self._add_images_summary_page(pdf, route_id)
-                elif page_name == 'traffic':
-                    self._add_traffic_page(pdf, route_id)
-                elif page_name == 'road_quality':
-                    self._add_road_quality_page(pdf, route_id)
-                elif page_name == 'environmental':
-                    self._add_environmental_page(pdf, route_id)
-                elif page_name == 'api_status':
-                    self._add_api_status_page(pdf, route_id)
+            pdf = EnhancedRoutePDF(self, unicode_font=self.unicode_font)
+            
+            # Generate each requested page on one shared database connection. Page
+            # data (SQLite and external APIs) is fetched concurrently up front; only
+            # the rendering into the single FPDF document is sequential. The overview
+            # map downloads on the report's executor while the pages render; leaving
+            # the block waits for it and shuts the executor down
+            with self._conn(), ThreadPoolExecutor(max_workers=1, thread_name_prefix='static-map') as map_executor:
+                self._local.map_executor = map_executor
+                self._local.page_data = self._prefetch_page_data(route_id, requested_pages)
+                try:
+                    for page_name in requested_pages:
+                        print(f"   Generating {self.available_pages[page_name]}...")
+                        
+                        if self.collapse_error_pages and self._skip_failed_page(page_name, route_id):
+                            continue
+                        self._page_builders[page_name](pdf, route_id)
+                    
+                    if self._local.page_errors:
+                        self._add_page_errors_page(pdf)
+
+                finally:
+                    self._local.page_data = None
+                    self._local.map_executor = None
             
             # Save PDF
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = pdf.generated_at.strftime("%Y%m%d_%H%M%S")
             filename = f"complete_route_analysis_{route_id}_{timestamp}.pdf"
-            filepath = os.path.join('reports', filename)
+            filepath = os.path.join(self.reports_dir, filename)
             
-            os.makedirs('reports', exist_ok=True)
+            # fpdf2 serializes the whole document here; page-by-page streaming would
+            # mean replacing its private OutputProducer, so pages stay in memory.
+            # The finished buffer goes to disk in a single write_bytes() call
             pdf.output(filepath)
             
             print(f"Complete PDF generated: {filepath}")
@@ -708,68 +1019,208 @@ class PDFGenerator:
             traceback.print_exc()
             return None
     
+    def _fetch_page_data(self, page_name: str, route_id: str):
+        """Fetch the data a page renders (no PDF access, safe in a worker thread)"""
+        fetcher = self._page_fetchers.get(page_name)
+        return fetcher(route_id) if fetcher else None
+    
+    def _prefetch_page_data(self, route_id: str, page_names: List[str]) -> Dict[str, Any]:
+        """Fetch the data of all requested pages concurrently"""
+        page_names = list(dict.fromkeys(name for name in page_names if name in self._page_fetchers))
+        if len(page_names) < 2:
+            return {}
+        
+        # Workers share the report's caches and map executor with the rendering thread
+        caches = getattr(self._local, 'caches', None)
+        map_executor = getattr(self._local, 'map_executor', None)
+        
+        def fetch(page_name: str):
+            self._local.caches = caches
+            self._local.map_executor = map_executor
+            return self._fetch_page_data(page_name, route_id)
+        
+        page_data = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(page_names))) as executor:
+            futures = {executor.submit(fetch, name): name for name in page_names}
+            for future in as_completed(futures):
+                page_name = futures[future]
+                try:
+                    page_data[page_name] = future.result()
+                except Exception as e:
+                    # The page builder fetches again itself and handles the error as before
+                    print(f"Prefetch failed for {page_name} page: {e}")
+        return page_data
+    
+    def _page_data(self, page_name: str, route_id: str):
+        """Data prefetched for a page of the current report, fetched now otherwise"""
+        prefetched = getattr(self._local, 'page_data', None)
+        if prefetched and page_name in prefetched:
+            return prefetched.pop(page_name)
+        return self._fetch_page_data(page_name, route_id)
+    
+    def _skip_failed_page(self, page_name: str, route_id: str) -> bool:
+        """Record and skip a page whose data call returned an error, before it adds a page"""
+        if page_name not in self._page_fetchers:
+            return False
+        
+        try:
+            data = self._page_data(page_name, route_id)
+            error = data.get('error') if isinstance(data, dict) else None
+        except Exception as e:
+            error = str(e)
+        if error:
+            self._local.page_errors.append(f"{self.available_pages[page_name]}: {error}")
+            print(f"   ⚠️ Skipped {page_name} page: {error}")
+            return True
+        
+        # Hand the data back to the page builder
+        self._local.page_data[page_name] = data
+        return False
+    
+    def _add_page_errors_page(self, pdf: 'EnhancedRoutePDF') -> None:
+        """List the pages skipped because their data was unavailable"""
+        try:
+            pdf.add_page()
+            pdf.add_section_header("SECTIONS WITH UNAVAILABLE DATA", "warning")
+            pdf.set_font('Helvetica', '', 10)
+            pdf.set_text_color(0, 0, 0)
+            for error in self._local.page_errors:
+                pdf.multi_cell(0, 6, f"- {error}", 0, 'L', new_x='LMARGIN', new_y='NEXT')
+        except Exception as e:
+            print(f"Error adding page errors summary: {e}")
+    
+    def _report_cache(self, name: str) -> Dict:
+        """Named cache of the report this thread is generating (a throwaway dict outside a report)"""
+        caches = getattr(self._local, 'caches', None)
+        if caches is None:
+            return {}
+        return caches.setdefault(name, {})
+    
+    def _get_route(self, route_id: str) -> Optional[Dict]:
+        """Route row, cached for the report being generated"""
+        cache = self._report_cache('routes')
+        route = cache.get(route_id)
+        if route is None:
+            route = self.db_manager.get_route(route_id)
+            if route is not None:
+                # Table-width address views, sliced once per report
+                route['_from_short'] = (route.get('from_address') or 'Unknown')[:self._ADDRESS_LIMIT]
+                route['_to_short'] = (route.get('to_address') or 'Unknown')[:self._ADDRESS_LIMIT]
+                cache[route_id] = route
+        return route
+    
+    def _get_overview(self, route_id: str) -> Dict:
+        """Enhanced route overview, cached for the report being generated"""
+        cache = self._report_cache('overviews')
+        overview = cache.get(route_id)
+        if overview is None:
+            overview = self.route_api.get_enhanced_route_overview(route_id)
+            if not overview.get('error'):
+                self._classify_highways(overview)
+                self._route_coords(overview)
+                cache[route_id] = overview
+        return overview
+    
+    def _classify_highways(self, enhanced_data: Dict) -> Dict:
+        """NH/SH/MDR flags and leading names of the overview's highways, stored on the overview"""
+        classified = enhanced_data.get('_classified')
+        if classified is not None:
+            return classified
+        
+        highway_data = enhanced_data.get('highways', {})
+        highways = highway_data.get('highways', []) if not highway_data.get('error') else []
+        
+        classified = {'has_nh_prefix': False, 'has_sh': False, 'has_mdr': False, 'has_nh': False, 'names_top3': []}
+        for highway in highways:
+            highway_name = highway.get('highway_name', '')
+            if highway_name.startswith('NH-'):
+                classified['has_nh_prefix'] = True
+            elif highway_name.startswith('SH-'):
+                classified['has_sh'] = True
+            elif highway_name.startswith('MDR-'):
+                classified['has_mdr'] = True
+            if 'NH' in highway_name:
+                classified['has_nh'] = True
+            if len(classified['names_top3']) < 3:
+                classified['names_top3'].append(highway_name)
+        
+        enhanced_data['_classified'] = classified
+        return classified
+    
+    def _route_coords(self, enhanced_data: Dict):
+        """(n, 2) float array of the overview's route point latitudes/longitudes, stored on the overview"""
+        coords = enhanced_data.get('_route_coords')
+        if coords is None:
+            import numpy as np
+            route_points = enhanced_data.get('route_points') or []
+            coords = np.array([(point['latitude'], point['longitude']) for point in route_points],
+                              dtype=np.float64).reshape(-1, 2)
+            enhanced_data['_route_coords'] = coords
+        return coords
+    
+    def _fetch_overview_data(self, route_id: str) -> Dict:
+        """Enhanced overview data (needs the tracked RouteAPI), starting the map download in the background"""
+        overview = self._get_overview(route_id)
+        map_executor = getattr(self._local, 'map_executor', None)
+        if map_executor and not overview.get('error') and '_map_future' not in overview:
+            overview['_map_future'] = map_executor.submit(self._generate_enhanced_map_image, overview)
+        return overview
+    
+    def _fetch_emergency_data(self, route_id: str) -> Dict:
+        """Emergency analyzer data, falling back to the RouteAPI summary"""
+        emergency_data = self._get_emergency_data_from_db(route_id)
+        if not emergency_data:
+            emergency_data = self.page_route_api.get_emergency_data(route_id)
+        return emergency_data
+    
+    def _fetch_traffic_data(self, route_id: str) -> Dict:
+        """Traffic data from the cache, refreshed through RouteAPI when stale"""
+        traffic_data = self.db_manager.get_cached_traffic_data(route_id)
+        if traffic_data is None:
+            traffic_data = self.page_route_api.get_traffic_data(route_id)
+            if 'error' not in traffic_data:
+                self.db_manager.store_traffic_cache(route_id, traffic_data)
+        return traffic_data
+    
+    def _load_logo(self, logo_path: str) -> Optional[bytes]:
+        """Logo file contents, cached across reports (None if the file is missing)"""
+        logo = self._LOGO_CACHE.get(logo_path)
+        if logo is None and os.path.exists(logo_path):
+            with open(logo_path, 'rb') as f:
+                logo = self._LOGO_CACHE[logo_path] = f.read()
+        return logo
+    
+    def _draw_title_header(self, pdf: 'EnhancedRoutePDF', logo: Optional[bytes]) -> None:
+        """HPCL branding in the title page header band, next to the logo if there is one"""
+        if logo:
+            # Add HPCL logo on the left, company branding next to it
+            pdf.image(BytesIO(logo), x=15, y=15, w=40, h=40)
+            x, lines = 65, self._TITLE_HEADER_WITH_LOGO
+        else:
+            x, lines = 20, self._TITLE_HEADER_TEXT_ONLY
+        
+        pdf.set_text_color(255, 255, 255)
+        for text, style, size, y, height in lines:
+            pdf.set_font('Helvetica', style, size)
+            pdf.set_xy(x, y)
+            pdf.cell(0, height, text, 0, 1, 'L')
+    
     def _add_title_page(self, pdf: 'EnhancedRoutePDF', route: Dict):
         """Add professional title page with HPCL branding - Updated Layout"""
         pdf.add_page()
         
-        # Background gradient effect
-        pdf.set_fill_color(245, 248, 252)
-        pdf.rect(0, 0, 210, 297, 'F')
-        
-        # Header with HPCL branding
+        # Background and HPCL branding band (pre-serialized, identical for every report);
+        # the fill color is left at the band color as before
+        pdf._out(pdf._title_backdrop_ops)
         pdf.set_fill_color(*self.primary_color)
-        pdf.rect(0, 0, 210, 90, 'F')
         
         logo_path = os.path.join('static', 'images', 'Hindustan_Petroleum_Logo.svg.png')
-        
         try:
-            if os.path.exists(logo_path):
-                # Add HPCL logo on the left
-                pdf.image(logo_path, x=15, y=15, w=40, h=40)
-                
-                # Company branding next to logo
-                pdf.set_font('Helvetica', 'B', 20)
-                pdf.set_text_color(255, 255, 255)
-                pdf.set_xy(65, 20)
-                pdf.cell(0, 12, 'HINDUSTAN PETROLEUM CORPORATION LIMITED', 0, 1, 'L')
-                
-                pdf.set_font('Helvetica', '', 12)
-                pdf.set_xy(65, 35)
-                pdf.cell(0, 8, 'Journey Risk Management Division', 0, 1, 'L')
-                
-                pdf.set_font('Helvetica', 'I', 10)
-                pdf.set_xy(65, 50)
-                pdf.cell(0, 6, 'Powered by Route Analytics Pro - AI Intelligence Platform', 0, 1, 'L')
-            else:
-                # Fallback without logo
-                pdf.set_font('Helvetica', 'B', 26)
-                pdf.set_text_color(255, 255, 255)
-                pdf.set_xy(20, 25)
-                pdf.cell(0, 15, 'HINDUSTAN PETROLEUM CORPORATION LIMITED', 0, 1, 'L')
-                
-                pdf.set_font('Helvetica', '', 14)
-                pdf.set_xy(20, 45)
-                pdf.cell(0, 8, 'Journey Risk Management Division', 0, 1, 'L')
-                
-                pdf.set_font('Helvetica', 'I', 10)
-                pdf.set_xy(20, 55)
-                pdf.cell(0, 6, 'Powered by Route Analytics Pro - AI Intelligence Platform', 0, 1, 'L')
-                
+            self._draw_title_header(pdf, self._load_logo(logo_path))
         except Exception as e:
             print(f"Error loading HPCL logo: {e}")
             # Fallback to text-only branding if logo fails to load
-            pdf.set_font('Helvetica', 'B', 24)
-            pdf.set_text_color(255, 255, 255)
-            pdf.set_xy(20, 25)
-            pdf.cell(0, 15, 'HINDUSTAN PETROLEUM CORPORATION LIMITED', 0, 1, 'L')
-            
-            pdf.set_font('Helvetica', '', 12)
-            pdf.set_xy(20, 45)
-            pdf.cell(0, 8, 'Journey Risk Management Division', 0, 1, 'L')
-            
-            pdf.set_font('Helvetica', 'I', 10)
-            pdf.set_xy(20, 55)
-            pdf.cell(0, 6, 'Powered by Route Analytics Pro - AI Intelligence Platform', 0, 1, 'L')
+            self._draw_title_header(pdf, None)
         
         # Main title section - Moved down and improved layout
         pdf.set_xy(0, 110)
@@ -807,8 +1258,8 @@ class PDFGenerator:
             f"Destination: MOTI FILLING STATION [0041025372]",
             f"Total Distance: {route.get('distance', 'Unknown')}",
             f"Estimated Duration: {route.get('duration', 'Unknown')}",
-            f"Analysis Date: {datetime.datetime.now().strftime('%B %d, %Y')}",
-            f"Report Generated: {datetime.datetime.now().strftime('%I:%M %p')}"
+            f"Analysis Date: {pdf.generated_at.strftime('%B %d, %Y')}",
+            f"Report Generated: {pdf.generated_at.strftime('%I:%M %p')}"
         ]
         
         y_pos = 205
@@ -826,7 +1277,7 @@ class PDFGenerator:
             self._add_page_header(pdf, "COMPREHENSIVE ROUTE OVERVIEW & STATISTICS", icon="📊")
             
             # Get enhanced overview data
-            enhanced_data = self.route_api.get_enhanced_route_overview(route_id)
+            enhanced_data = self._page_data('overview', route_id)
             
             if enhanced_data.get('error'):
                 self._add_error_message(pdf, f"Failed to load enhanced route data: {enhanced_data.get('error')}")
@@ -894,14 +1345,22 @@ class PDFGenerator:
             pdf.set_line_width(0.5)
             
             current_y = table_start_y
+            divider_x = table_start_x + col_widths[0]
+            row_rules = []
+            
+            # Line counts per column in one pass each (value font, then label font)
+            labels = [str(row[0]) for row in table_data]
+            values = [str(row[1]) for row in table_data]
+            pdf.set_font('Helvetica', '', 10)
+            value_line_counts = self._line_counts(pdf, values, col_widths[1] - 4)
+            pdf.set_font('Helvetica', 'B', 10)
+            label_line_counts = self._line_counts(pdf, labels, col_widths[0] - 4)
             
             # Draw each row with dynamic height
-            for i, row in enumerate(table_data):
-                label = str(row[0])
-                value = str(row[1])
-                
-                # Calculate required height for this row
-                row_height = self._calculate_row_height(pdf, value, col_widths[1])
+            for i, (label, value) in enumerate(zip(labels, values)):
+                label_lines = label_line_counts[i]
+                value_lines = value_line_counts[i]
+                row_height = max(12, 4 + 5 * max(label_lines, value_lines))
                 
                 # Alternating row background
                 if i % 2 == 0:
@@ -909,8 +1368,8 @@ class PDFGenerator:
                 else:
                     pdf.set_fill_color(245, 245, 245)  # Light gray
                 
-                # Draw row background
-                pdf.rect(table_start_x, current_y, table_width, row_height, 'DF')
+                # Draw row background (borders are stroked once after the loop)
+                pdf.rect(table_start_x, current_y, table_width, row_height, 'F')
                 
                 # Draw label column (first column - bold)
                 pdf.set_text_color(0, 0, 0)
@@ -918,7 +1377,7 @@ class PDFGenerator:
                 pdf.set_xy(table_start_x + 2, current_y + 2)
                 
                 # For long labels, wrap them too
-                if len(label) > 25:
+                if label_lines > 1:
                     pdf.multi_cell(col_widths[0] - 4, 5, label, 0, 'L')
                 else:
                     pdf.cell(col_widths[0] - 4, row_height - 4, label, 0, 0, 'L')
@@ -928,24 +1387,17 @@ class PDFGenerator:
                 pdf.set_xy(table_start_x + col_widths[0] + 2, current_y + 2)
                 
                 # Use multi_cell for long text with proper wrapping
-                if len(value) > 35:
-                    # Calculate how many lines we need
-                    lines_needed = len(value) // 35 + 1
+                if value_lines > 1:
                     pdf.multi_cell(col_widths[1] - 4, 5, value, 0, 'L')
                 else:
                     pdf.cell(col_widths[1] - 4, row_height - 4, value, 0, 0, 'L')
                 
-                # Internal vertical red line
-                pdf.set_draw_color(0, 0, 0)
-                pdf.line(table_start_x + col_widths[0], current_y, table_start_x + col_widths[0], current_y + row_height)
-                
-                # Horizontal red line under the row
-                pdf.line(table_start_x, current_y + row_height, table_start_x + table_width, current_y + row_height)
-                
                 # Move to next row
                 current_y += row_height
+                row_rules.append((table_start_x, current_y, table_start_x + table_width, current_y))
             
-            # Final outer border rectangle
+            # Grid as one path: column divider and row rules, then the outer border
+            pdf.stroke_lines([(divider_x, table_start_y, divider_x, current_y)] + row_rules[:-1])
             total_height = current_y - table_start_y
             pdf.rect(table_start_x, table_start_y, table_width, total_height)
             
@@ -955,71 +1407,28 @@ class PDFGenerator:
         except Exception as e:
             print(f"Error drawing dynamic route info table: {e}")
 
-    def _calculate_row_height(self, pdf: 'EnhancedRoutePDF', text: str, column_width: int) -> int:
-        """Calculate the required row height based on text length"""
-        try:
-            # Base height
-            base_height = 12
-            
-            # Characters per line (approximate)
-            chars_per_line = (column_width - 4) // 3  # Rough estimate: 3 pixels per character
-            
-            # Calculate number of lines needed
-            lines_needed = max(1, len(text) // chars_per_line + (1 if len(text) % chars_per_line > 0 else 0))
-            
-            # Calculate height: base height + extra height for additional lines
-            if lines_needed <= 1:
-                return base_height
-            elif lines_needed <= 2:
-                return base_height + 8
-            elif lines_needed <= 3:
-                return base_height + 16
-            else:
-                return base_height + 24  # Maximum height for very long text
-            
-        except Exception as e:
-            print(f"Error calculating row height: {e}")
-            return 12  # Default height
+    def _measure(self, pdf: 'EnhancedRoutePDF', text: str) -> float:
+        """Width of text in the current font, memoized per (font, size, text) for the report"""
+        cache = self._report_cache('widths')
+        key = (pdf.font_family, pdf.font_style, pdf.font_size_pt, text)
+        width = cache.get(key)
+        if width is None:
+            width = cache[key] = pdf.get_string_width(text)
+        return width
+
+    def _measure_batch(self, pdf: 'EnhancedRoutePDF', texts: List[str]) -> List[float]:
+        """Widths of several texts in the current font"""
+        return [self._measure(pdf, text) for text in texts]
+
+    def _line_counts(self, pdf: 'EnhancedRoutePDF', texts: List[str], width: float) -> List[int]:
+        """multi_cell line counts for texts in the current font; only texts wider than one line are split"""
+        single_line = width - 2 * pdf.c_margin
+        texts = [pdf._pdf_text(text) for text in texts]  # measure what cell/multi_cell will draw
+        return [
+            1 if text_width < single_line and '\n' not in text else len(pdf.split_lines(width, 5, text))
+            for text, text_width in zip(texts, self._measure_batch(pdf, texts))
+        ]
 
-    def _wrap_text_for_width(self, text: str, max_width: int) -> List[str]:
-        """Wrap text to fit within specified width (improved version)"""
-        try:
-            # Approximate characters per line based on width
-            chars_per_line = max(20, (max_width - 4) // 3)
-            
-            words = text.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                # Check if adding this word would exceed the line length
-                test_line = f"{current_line} {word}".strip()
-                
-                if len(test_line) <= chars_per_line:
-                    current_line = test_line
-                else:
-                    # If current line has content, save it and start new line
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = word
-                    else:
-                        # Word is too long, break it
-                        if len(word) > chars_per_line:
-                            # Break long word
-                            lines.append(word[:chars_per_line])
-                            current_line = word[chars_per_line:]
-                        else:
-                            current_line = word
-            
-            # Add the last line
-            if current_line:
-                lines.append(current_line)
-            
-            return lines if lines else [text[:chars_per_line]]
-            
-        except Exception as e:
-            print(f"Error wrapping text: {e}")
-            return [text]
     def _add_safety_compliance_table(self, pdf: 'EnhancedRoutePDF', enhanced_data: Dict) -> None:
         """Add Key Safety Measures & Regulatory Compliance table with dynamic content and intelligent rest breaks calculation"""
         try:
@@ -1043,24 +1452,18 @@ class PDFGenerator:
             
             # 1. DYNAMIC SPEED LIMITS based on detected highways and terrain
             speed_parts = []
-            highway_types = set()
-            
-            # Analyze detected highways
-            for highway in highways:
-                highway_name = highway.get('highway_name', '')
-                if highway_name.startswith('NH-'):
-                    highway_types.add('NH')
-                elif highway_name.startswith('SH-'):
-                    highway_types.add('SH')
-                elif highway_name.startswith('MDR-'):
-                    highway_types.add('MDR')
+            
+            # Highway classification, computed once per overview
+            classified = self._classify_highways(enhanced_data)
+            has_nh = classified['has_nh']
+            highway_names = classified['names_top3']
             
             # Add highway-specific speed limits
-            if 'NH' in highway_types:
+            if classified['has_nh_prefix']:
                 speed_parts.append("NH: 60 km/h")
-            if 'SH' in highway_types:
+            if classified['has_sh']:
                 speed_parts.append("SH: 55 km/h")
-            if 'MDR' in highway_types:
+            if classified['has_mdr']:
                 speed_parts.append("MDR: 55 km/h")
             
             # Add terrain-based speed limits
@@ -1082,7 +1485,7 @@ class PDFGenerator:
                 night_driving = "Prohibited: 00:00–06:00 hrs"
             
             # 3. INTELLIGENT REST BREAKS CALCULATION
-            rest_breaks = self._calculate_intelligent_rest_breaks(duration, distance, terrain_type, highways)
+            rest_breaks = self._calculate_intelligent_rest_breaks(duration, distance, terrain_type, highways, has_nh)
             
             # 4. DYNAMIC VEHICLE COMPLIANCE based on route characteristics
             requirements = ["Check brakes, tires, lights"]
@@ -1090,7 +1493,7 @@ class PDFGenerator:
             if 'Hilly' in terrain_type or 'Mountainous' in terrain_type:
                 requirements.append("engine cooling system")
             
-            if any('NH' in h.get('highway_name', '') for h in highways):
+            if has_nh:
                 requirements.append("high-speed capability")
             
             requirements.append("emergency equipment")
@@ -1099,12 +1502,12 @@ class PDFGenerator:
             # 5. DYNAMIC PERMITS based on highways detected
             permits_base = "Carry valid transport permits, Hazardous vehicle license"
             if highways:
-                permits_documents = f"{permits_base}, Highway permits for {', '.join([h.get('highway_name', '')[:6] for h in highways[:2]])}, MSDS sheets"
+                permits_documents = f"{permits_base}, Highway permits for {', '.join(name[:6] for name in highway_names[:2])}, MSDS sheets"
             else:
                 permits_documents = f"{permits_base} and MSDS sheets"
             
             # 6. VTS REQUIREMENTS (enhanced based on route type)
-            if any('NH' in h.get('highway_name', '') for h in highways):
+            if has_nh:
                 vts_requirement = "VTS device shall be functional (Mandatory for NH routes)"
             else:
                 vts_requirement = "VTS device shall be functional"
@@ -1131,7 +1534,6 @@ class PDFGenerator:
             notes = ["Ensure all regulatory requirements are met before journey commencement."]
             
             if highways:
-                highway_names = [h.get('highway_name', '') for h in highways[:3]]
                 notes.append(f"Route includes major highways: {', '.join(highway_names)}.")
             
             if 'Hilly' in terrain_type or 'Mountainous' in terrain_type:
@@ -1142,7 +1544,7 @@ class PDFGenerator:
             notes.append("Speed limits may vary based on local regulations and road conditions.")
             
             compliance_note = " ".join(notes)
-            wrapped_note = self._wrap_text(compliance_note, 180)
+            wrapped_note = self._wrap_text(pdf, compliance_note, 180)
             for line in wrapped_note:
                 pdf.cell(0, 4, line, 0, 1, 'L')
             
@@ -1161,7 +1563,8 @@ class PDFGenerator:
             ]
             self._draw_enhanced_table(pdf, safety_table_data)
 
-    def _calculate_intelligent_rest_breaks(self, duration: str, distance: str, terrain_type: str, highways: List[Dict]) -> str:
+    def _calculate_intelligent_rest_breaks(self, duration: str, distance: str, terrain_type: str, highways: List[Dict],
+                                          has_nh: Optional[bool] = None) -> str:
         """Calculate intelligent rest breaks based on multiple factors"""
         try:
             # Extract duration in hours
@@ -1200,7 +1603,8 @@ class PDFGenerator:
                 rest_recommendations.append("Extra 5 min for urban stress")
             
             # 3. HIGHWAY-BASED ADJUSTMENTS
-            has_nh = any('NH' in h.get('highway_name', '') for h in highways)
+            if has_nh is None:
+                has_nh = any('NH' in h.get('highway_name', '') for h in highways)
             if has_nh and duration_hours > 4:
                 rest_recommendations.append("Highway driving: Extended breaks recommended")
             
@@ -1239,31 +1643,24 @@ class PDFGenerator:
     def _parse_duration_to_hours(self, duration_str: str) -> float:
         """Parse duration string to hours"""
         try:
-            import re
             duration_str = duration_str.lower()
             
             hours = 0
             minutes = 0
             
             # Extract hours
-            hour_patterns = [r'(\d+)\s*h', r'(\d+)\s*hour', r'(\d+)\s*hr']
-            for pattern in hour_patterns:
-                hour_match = re.search(pattern, duration_str)
-                if hour_match:
-                    hours = int(hour_match.group(1))
-                    break
+            hour_match = _HOUR_RE.search(duration_str)
+            if hour_match:
+                hours = int(hour_match.group(1))
             
             # Extract minutes
-            min_patterns = [r'(\d+)\s*m', r'(\d+)\s*min', r'(\d+)\s*minute']
-            for pattern in min_patterns:
-                min_match = re.search(pattern, duration_str)
-                if min_match:
-                    minutes = int(min_match.group(1))
-                    break
+            min_match = _MIN_RE.search(duration_str)
+            if min_match:
+                minutes = int(min_match.group(1))
             
             # If only a single number, assume hours
             if hours == 0 and minutes == 0:
-                number_match = re.search(r'(\d+)', duration_str)
+                number_match = _NUM_RE.search(duration_str)
                 if number_match:
                     hours = int(number_match.group(1))
             
@@ -1277,23 +1674,22 @@ class PDFGenerator:
     def _parse_distance_to_km(self, distance_str: str) -> float:
         """Parse distance string to kilometers"""
         try:
-            import re
             distance_str = distance_str.lower()
             
             # Look for kilometers
-            km_match = re.search(r'([\d,\.]+)\s*k', distance_str)
+            km_match = _KM_RE.search(distance_str)
             if km_match:
                 km_str = km_match.group(1).replace(',', '')
                 return float(km_str)
             
             # Look for miles and convert
-            mile_match = re.search(r'([\d,\.]+)\s*m', distance_str)
+            mile_match = _MILE_RE.search(distance_str)
             if mile_match:
                 miles_str = mile_match.group(1).replace(',', '')
                 return float(miles_str) * 1.60934  # Convert to km
             
             # Default number extraction
-            number_match = re.search(r'([\d,\.]+)', distance_str)
+            number_match = _DECIMAL_RE.search(distance_str)
             if number_match:
                 return float(number_match.group(1).replace(',', ''))
             
@@ -1313,11 +1709,11 @@ class PDFGenerator:
             
             # Get route data for risk analysis
             sharp_turns = enhanced_data.get('sharp_turns', [])
-            route_points = enhanced_data.get('route_points', [])
+            route_coords = self._route_coords(enhanced_data)
             route_info = enhanced_data.get('route_info', {})
             
             # Get risk zones data
-            risk_zones = self._compile_high_risk_zones(route_id, sharp_turns, route_points, route_info)
+            risk_zones = self._compile_high_risk_zones(route_id, sharp_turns, route_coords, route_info)
             
             if not risk_zones:
                 pdf.set_font('Helvetica', 'I', 10)
@@ -1345,21 +1741,12 @@ class PDFGenerator:
             # Column configuration for risk zones table
             col_widths = [30, 20, 20, 30, 25, 25, 40]  # Type, Dist Start, Dist End, Coordinates, Risk, Speed, Action
             headers = ['Type', 'From Start', 'From End', 'Coordinates', 'Risk Level', 'Speed Limit', 'Driver Action']
+            # Body cells that always fit on one line (distances, risk level, truncated speed) skip word-wrapping
+            single_line_cols = (1, 2, 4, 5)
             
-            # Prepare table data with headers
+            # Prepare table data with headers; rows are pre-formatted when the zones are compiled
             table_data = [headers]
-            
-            for zone in zones_data[:12]:  # Limit to 12 zones
-                row = [
-                    zone.get('type', 'Unknown'),
-                    f"{zone.get('dist_from_start', 0):.1f} km",
-                    f"{zone.get('dist_from_end', 0):.1f} km",
-                    zone.get('coordinates', 'N/A')[:20],
-                    zone.get('risk_level', 'Medium'),
-                    zone.get('speed_limit', 'Normal')[:12],
-                    zone.get('driver_action', 'Exercise caution')
-                ]
-                table_data.append(row)
+            table_data.extend(zone.get('_row') or self._format_zone_row(zone) for zone in zones_data[:12])  # Limit to 12 zones
             
             # Enhanced table styling
             row_height = 12
@@ -1370,6 +1757,9 @@ class PDFGenerator:
             pdf.set_draw_color(0, 0, 0)  # Red borders
             pdf.set_line_width(0.5)
             
+            # Text is black in every row; only the font changes after the header
+            pdf.set_text_color(0, 0, 0)
+            
             # Draw each row
             for i, row in enumerate(table_data):
                 y_pos = table_start_y + i * row_height
@@ -1377,48 +1767,34 @@ class PDFGenerator:
                 # Header row special styling
                 if i == 0:
                     pdf.set_fill_color(173, 216, 230)   # HPCL blue header
-                    pdf.set_text_color(0, 0, 0)  # White text
                     pdf.set_font('Helvetica', 'B', 10)
                 else:
+                    if i == 1:
+                        pdf.set_font('Helvetica', 'B', 7)
+                    
                     # Alternating row background
                     if i % 2 == 1:
                         pdf.set_fill_color(255, 255, 255)  # White
                     else:
                         pdf.set_fill_color(245, 245, 245)  # Light gray
-                    
-                    # Color coding based on risk level
-                    risk_level = zones_data[i-1].get('risk_level', 'Medium') if i <= len(zones_data) else 'Medium'
-                    if risk_level in ['Critical', 'High']:
-                        pdf.set_text_color(0, 0, 0)  # Red
-                    elif risk_level == 'Medium':
-                        pdf.set_text_color(0, 0, 0)  # Orange
-                    else:
-                        pdf.set_text_color(0, 0, 0)  # Green
-                    
-                    pdf.set_font('Helvetica', 'B', 7)
                 
-                # Draw row background
-                pdf.rect(table_start_x, y_pos, table_width, row_height, 'DF')
+                # Draw row background (grid is stroked once after the loop)
+                pdf.rect(table_start_x, y_pos, table_width, row_height, 'F')
                 
                 # Draw columns and content
                 x_pos = table_start_x
                 for j, cell in enumerate(row):
                     pdf.set_xy(x_pos + 1, y_pos + 2)
-                    pdf.multi_cell(col_widths[j] - 2, 4, str(cell), 0, 'L')
-                    
-                    # Internal vertical red line (if not last column)
-                    if j < len(row) - 1:
-                        pdf.set_draw_color(0, 0, 0)
-                        pdf.line(x_pos + col_widths[j], y_pos, x_pos + col_widths[j], y_pos + row_height)
-                    
+                    if i and j in single_line_cols:
+                        pdf.cell(col_widths[j] - 2, 4, str(cell), 0, 0, 'L')
+                    else:
+                        pdf.multi_cell(col_widths[j] - 2, 4, str(cell), 0, 'L')
                     x_pos += col_widths[j]
-                
-                # Horizontal red line under the row
-                pdf.set_draw_color(0, 0, 0)
-                pdf.line(table_start_x, y_pos + row_height, table_start_x + table_width, y_pos + row_height)
             
-            # Final outer border rectangle
-            pdf.rect(table_start_x, table_start_y, table_width, len(table_data) * row_height)
+            # Column and row separators as one path, then the outer border rectangle
+            table_height = len(table_data) * row_height
+            self._stroke_table_grid(pdf, table_start_x, table_start_y, col_widths, row_height, len(table_data))
+            pdf.rect(table_start_x, table_start_y, table_width, table_height)
             
             # Move cursor below the table
             pdf.set_y(table_start_y + len(table_data) * row_height + 5)
@@ -1426,20 +1802,41 @@ class PDFGenerator:
         except Exception as e:
             print(f"Error drawing risk zones enhanced table: {e}")
 
+    def _format_zone_row(self, zone: Dict) -> Tuple[str, ...]:
+        """Risk zones table cells for a zone, truncated to fit their columns"""
+        return (
+            zone.get('type', 'Unknown'),
+            f"{zone.get('dist_from_start', 0):.1f} km",
+            f"{zone.get('dist_from_end', 0):.1f} km",
+            zone.get('coordinates', 'N/A')[:20],
+            zone.get('risk_level', 'Medium'),
+            zone.get('speed_limit', 'Normal')[:12],
+            zone.get('driver_action', 'Exercise caution')
+        )
+
+    def _stroke_table_grid(self, pdf: 'EnhancedRoutePDF', x: float, y: float, col_widths: List[float],
+                           row_height: float, row_count: int) -> None:
+        """Stroke the inner column and row separators of a fixed-row-height table (or one row) as one path"""
+        width = sum(col_widths)
+        bottom = y + row_count * row_height
+        segments = [(col_x, y, col_x, bottom) for col_x in itertools.accumulate(col_widths[:-1], initial=x)][1:]
+        segments += [(x, y + i * row_height, x + width, y + i * row_height) for i in range(1, row_count)]
+        pdf.stroke_lines(segments)
+
     def _compile_high_risk_zones(self, route_id: str, sharp_turns: List[Dict], 
-                                route_points: List[Dict], route_info: Dict) -> List[Dict]:
-        """Compile high-risk zones from various data sources"""
+                                route_coords, route_info: Dict) -> List[Dict]:
+        """Compile high-risk zones from various data sources (cached per route for the report)"""
+        cache = self._report_cache('risk_zones')
+        cached = cache.get(route_id)
+        if cached is not None:
+            return cached
+        
         try:
             risk_zones = []
             
             # 1. SHARP TURNS (High Priority)
             critical_turns = [turn for turn in sharp_turns if turn.get('angle', 0) >= 70]
             for i, turn in enumerate(critical_turns[:8]):  # Top 8 critical turns
-                
-                dist_from_start, dist_from_end = self._calculate_distances_from_endpoints(
-                    turn['latitude'], turn['longitude'], route_points
-                )
-                
                 # Determine speed limit based on angle
                 angle = turn.get('angle', 0)
                 if angle >= 90:
@@ -1461,84 +1858,125 @@ class PDFGenerator:
                     'risk_level': risk_level,
                     'speed_limit': speed_limit,
                     'driver_action': driver_action,
-                    'dist_from_start': dist_from_start,
-                    'dist_from_end': dist_from_end,
-                    'priority': 1  # Highest priority
+                    'latitude': turn['latitude'],
+                    'longitude': turn['longitude'],
+                    'priority': 1,  # Highest priority
+                    '_rank': (1, _RISK_RANK[risk_level]),
+                    '_source': 'sharp_turns'
                 })
             
             # 2. BLIND SPOTS (Medium-High Priority)
             moderate_turns = [turn for turn in sharp_turns if 60 <= turn.get('angle', 0) < 70]
             for i, turn in enumerate(moderate_turns[:4]):  # Top 4 blind spots
-                
-                dist_from_start, dist_from_end = self._calculate_distances_from_endpoints(
-                    turn['latitude'], turn['longitude'], route_points
-                )
-                
                 risk_zones.append({
                     'type': f"Blind Spot #{i+1}",
                     'coordinates': f"{turn['latitude']:.5f}, {turn['longitude']:.5f}",
                     'risk_level': "Medium",
                     'speed_limit': "30 km/h",
                     'driver_action': "Use horn, stay alert",
-                    'dist_from_start': dist_from_start,
-                    'dist_from_end': dist_from_end,
-                    'priority': 2
+                    'latitude': turn['latitude'],
+                    'longitude': turn['longitude'],
+                    'priority': 2,
+                    '_rank': (2, _RISK_RANK['Medium']),
+                    '_source': 'sharp_turns'
                 })
             
-            # 3. ELEVATION CHANGES (From Database)
-            elevation_risks = self._get_elevation_risk_zones(route_id, route_points)
-            risk_zones.extend(elevation_risks)
+            # 3-6. DATABASE ZONES, all read on one connection
+            with self._conn() as conn:
+                # 3. ELEVATION CHANGES (From Database)
+                elevation_risks = self._get_elevation_risk_zones(conn, route_id)
+                risk_zones.extend(elevation_risks)
+                
+                # 4. TRAFFIC CONGESTION ZONES (From Database)
+                traffic_risks = self._get_traffic_risk_zones(conn, route_id)
+                risk_zones.extend(traffic_risks)
+                
+                # 5. COMMUNICATION DEAD ZONES (From Database)
+                communication_risks = self._get_communication_risk_zones(conn, route_id)
+                risk_zones.extend(communication_risks)
+                
+                # 6. ENVIRONMENTAL RISK ZONES (From Database)
+                environmental_risks = self._get_environmental_risk_zones(conn, route_id)
+                risk_zones.extend(environmental_risks)
             
-            # 4. TRAFFIC CONGESTION ZONES (From Database)
-            traffic_risks = self._get_traffic_risk_zones(route_id, route_points)
-            risk_zones.extend(traffic_risks)
+            # Distances from the route endpoints, for all zones in one batch
+            self._assign_endpoint_distances(risk_zones, route_coords)
             
-            # 5. COMMUNICATION DEAD ZONES (From Database)
-            communication_risks = self._get_communication_risk_zones(route_id, route_points)
-            risk_zones.extend(communication_risks)
+            # Sort by priority and risk level
+            risk_zones.sort(key=itemgetter('_rank'))
             
-            # 6. ENVIRONMENTAL RISK ZONES (From Database)
-            environmental_risks = self._get_environmental_risk_zones(route_id, route_points)
-            risk_zones.extend(environmental_risks)
+            risk_zones = self._dedupe_risk_zones(risk_zones)
             
-            # Sort by priority and risk level
-            risk_zones.sort(key=lambda x: (x.get('priority', 3), 
-                                        {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}.get(x.get('risk_level', 'Medium'), 2)))
+            # Table rows, formatted once and reused by every render of the cached zones
+            for zone in risk_zones:
+                zone['_row'] = self._format_zone_row(zone)
             
+            cache[route_id] = risk_zones
             return risk_zones
             
         except Exception as e:
             print(f"Error compiling risk zones: {e}")
             return []
 
-    def _calculate_distances_from_endpoints(self, lat: float, lng: float, route_points: List[Dict]) -> tuple:
-        """Calculate distances from start and end points"""
+    @staticmethod
+    def _dedupe_risk_zones(zones: List[Dict]) -> List[Dict]:
+        """Drop zones whose ~100 m grid cell already holds a higher-ranked zone from another source"""
+        # zones are rank-sorted, so the first source seen in a cell is its highest-ranked
+        # one; distinct zones of the same source (e.g. nearby turns) are all kept
+        cell_sources = {}
+        unique_zones = []
+        for zone in zones:
+            cell = (round(zone['latitude'], 3), round(zone['longitude'], 3))
+            if cell_sources.setdefault(cell, zone['_source']) == zone['_source']:
+                unique_zones.append(zone)
+        return unique_zones
+
+    def _assign_endpoint_distances(self, zones: List[Dict], route_coords) -> None:
+        """Set dist_from_start / dist_from_end on every zone from its latitude/longitude"""
         try:
-            if not route_points:
-                return 0, 0
-            
-            start_point = route_points[0]
-            end_point = route_points[-1]
+            if not zones:
+                return
+            if not len(route_coords):
+                raise ValueError("no route points")
             
-            # Calculate distance from start
-            dist_from_start = self._calculate_distance_km(
-                [lat, lng], [start_point['latitude'], start_point['longitude']]
-            )
+            # Done here rather than in SQL: the database queries already return only their
+            # LIMITed rows, sharp turns/blind spots never come from SQL, and SQLite's math
+            # functions are a compile-time option that not every build has
+            import numpy as np
+            lats = np.fromiter((zone['latitude'] for zone in zones), dtype=np.float64, count=len(zones))
+            lngs = np.fromiter((zone['longitude'] for zone in zones), dtype=np.float64, count=len(zones))
             
-            # Calculate distance from end
-            dist_from_end = self._calculate_distance_km(
-                [lat, lng], [end_point['latitude'], end_point['longitude']]
-            )
+            (start_lat, start_lng), (end_lat, end_lng) = route_coords[0].tolist(), route_coords[-1].tolist()
+            from_start = self._haversine_batch(lats, lngs, start_lat, start_lng)
+            from_end = self._haversine_batch(lats, lngs, end_lat, end_lng)
             
-            return dist_from_start, dist_from_end
+            for zone, dist_from_start, dist_from_end in zip(zones, from_start.tolist(), from_end.tolist()):
+                zone['dist_from_start'] = dist_from_start
+                zone['dist_from_end'] = dist_from_end
             
         except Exception as e:
-            return 0, 0
+            for zone in zones:
+                zone['dist_from_start'] = zone['dist_from_end'] = 0
+    
+    @staticmethod
+    def _haversine_batch(lats, lngs, ref_lat: float, ref_lng: float):
+        """Distances in kilometers from arrays of points to one reference point"""
+        import numpy as np
+        
+        R = 6371  # Earth's radius in kilometers
+        
+        lat_rad = np.radians(lats)
+        ref_lat_rad = np.radians(ref_lat)
+        delta_lat = np.radians(ref_lat - lats)
+        delta_lon = np.radians(ref_lng - lngs)
+        
+        a = (np.sin(delta_lat / 2) ** 2 +
+             np.cos(lat_rad) * np.cos(ref_lat_rad) * np.sin(delta_lon / 2) ** 2)
+        
+        return R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
     def _calculate_distance_km(self, point1: List[float], point2: List[float]) -> float:
         """Calculate distance between two points in kilometers"""
-        import math
-        
         lat1, lon1 = point1[0], point1[1]
         lat2, lon2 = point2[0], point2[1]
         
@@ -1557,183 +1995,176 @@ class PDFGenerator:
         
         return R * c
 
-    def _get_elevation_risk_zones(self, route_id: str, route_points: List[Dict]) -> List[Dict]:
+    @staticmethod
+    def _prep_haversine(lat: float, lng: float) -> tuple:
+        """Radians and latitude cosine of a point reused against many others"""
+        lat_rad = math.radians(lat)
+        return lat_rad, math.radians(lng), math.cos(lat_rad)
+
+    @staticmethod
+    def _haversine_from_prep(lat: float, lng: float, prep: tuple) -> float:
+        """Distance in kilometers from a point to a _prep_haversine point"""
+        ref_lat_rad, ref_lng_rad, ref_cos_lat = prep
+        lat_rad = math.radians(lat)
+        sin_dlat = math.sin((lat_rad - ref_lat_rad) / 2)
+        sin_dlon = math.sin((math.radians(lng) - ref_lng_rad) / 2)
+        a = sin_dlat * sin_dlat + ref_cos_lat * math.cos(lat_rad) * sin_dlon * sin_dlon
+        return 6371 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    def _get_elevation_risk_zones(self, conn: sqlite3.Connection, route_id: str) -> List[Dict]:
         """Get elevation-based risk zones from database"""
         try:
-            import sqlite3
-            
             elevation_risks = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                # Find significant elevation changes
-                cursor.execute("""
-                    SELECT latitude, longitude, elevation 
+            cursor = conn.cursor()
+            
+            # First 3 significant elevation changes (> 100 m between consecutive
+            # points), found by SQLite with a window function
+            cursor.execute("""
+                SELECT latitude, longitude, elevation_change
+                FROM (
+                    SELECT id, latitude, longitude,
+                           ABS(elevation - LAG(elevation) OVER (ORDER BY id)) AS elevation_change
                     FROM elevation_data 
                     WHERE route_id = ? 
-                    ORDER BY id
-                """, (route_id,))
-                
-                elevation_data = [dict(row) for row in cursor.fetchall()]
-                
-                # Analyze elevation changes
-                for i in range(1, len(elevation_data)):
-                    prev_elev = elevation_data[i-1]['elevation']
-                    curr_elev = elevation_data[i]['elevation']
-                    elevation_change = abs(curr_elev - prev_elev)
-                    
-                    if elevation_change > 100:  # Significant elevation change
-                        dist_from_start, dist_from_end = self._calculate_distances_from_endpoints(
-                            elevation_data[i]['latitude'], elevation_data[i]['longitude'], route_points
-                        )
-                        
-                        elevation_risks.append({
-                            'type': f"Elevation Change #{len(elevation_risks)+1}",
-                            'coordinates': f"{elevation_data[i]['latitude']:.5f}, {elevation_data[i]['longitude']:.5f}",
-                            'risk_level': "High" if elevation_change > 200 else "Medium",
-                            'speed_limit': "15 km/h" if elevation_change > 200 else "25 km/h",
-                            'driver_action': "Use lower gear, maintain control",
-                            'dist_from_start': dist_from_start,
-                            'dist_from_end': dist_from_end,
-                            'priority': 2
-                        })
+                )
+                WHERE elevation_change > 100
+                ORDER BY id
+                LIMIT 3
+            """, (route_id,))
+            
+            for lat, lng, elevation_change in cursor:
+                risk_level = "High" if elevation_change > 200 else "Medium"
+                elevation_risks.append({
+                    'type': f"Elevation Change #{len(elevation_risks)+1}",
+                    'coordinates': f"{lat:.5f}, {lng:.5f}",
+                    'risk_level': risk_level,
+                    'speed_limit': "15 km/h" if elevation_change > 200 else "25 km/h",
+                    'driver_action': "Use lower gear, maintain control",
+                    'latitude': lat,
+                    'longitude': lng,
+                    'priority': 2,
+                    '_rank': (2, _RISK_RANK[risk_level]),
+                    '_source': 'elevation_data'
+                })
             
-            return elevation_risks[:3]  # Limit to top 3
+            return elevation_risks  # Limited to top 3
             
         except Exception as e:
             return []
 
-    def _get_traffic_risk_zones(self, route_id: str, route_points: List[Dict]) -> List[Dict]:
+    def _get_traffic_risk_zones(self, conn: sqlite3.Connection, route_id: str) -> List[Dict]:
         """Get traffic congestion risk zones from database"""
         try:
-            import sqlite3
-            
             traffic_risks = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT latitude, longitude, congestion_level, current_speed 
-                    FROM traffic_data 
-                    WHERE route_id = ? AND congestion_level IN ('HEAVY', 'MODERATE')
-                    ORDER BY 
-                        CASE congestion_level 
-                            WHEN 'HEAVY' THEN 1 
-                            WHEN 'MODERATE' THEN 2 
-                            ELSE 3 
-                        END
-                """, (route_id,))
-                
-                traffic_data = [dict(row) for row in cursor.fetchall()]
-                
-                for i, traffic in enumerate(traffic_data[:3]):  # Top 3 congested areas
-                    dist_from_start, dist_from_end = self._calculate_distances_from_endpoints(
-                        traffic['latitude'], traffic['longitude'], route_points
-                    )
-                    
-                    congestion = traffic['congestion_level']
-                    speed = traffic.get('current_speed', 0)
-                    
-                    traffic_risks.append({
-                        'type': f"High Congestion Area #{i+1}",
-                        'coordinates': f"{traffic['latitude']:.5f}, {traffic['longitude']:.5f}",
-                        'risk_level': "High" if congestion == 'HEAVY' else "Medium",
-                        'speed_limit': f"{max(10, speed)} km/h" if speed > 0 else "25 km/h",
-                        'driver_action': "Avoid peak hours, plan stops",
-                        'dist_from_start': dist_from_start,
-                        'dist_from_end': dist_from_end,
-                        'priority': 2
-                    })
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT latitude, longitude, congestion_level, current_speed 
+                FROM traffic_data 
+                WHERE route_id = ? AND congestion_level IN ('HEAVY', 'MODERATE')
+                ORDER BY 
+                    CASE congestion_level 
+                        WHEN 'HEAVY' THEN 1 
+                        WHEN 'MODERATE' THEN 2 
+                        ELSE 3 
+                    END,
+                    id
+                LIMIT 3
+            """, (route_id,))
+            
+            for i, traffic in enumerate(cursor):  # Top 3 congested areas
+                congestion = traffic['congestion_level']
+                speed = traffic['current_speed']
+                risk_level = "High" if congestion == 'HEAVY' else "Medium"
+                
+                traffic_risks.append({
+                    'type': f"High Congestion Area #{i+1}",
+                    'coordinates': f"{traffic['latitude']:.5f}, {traffic['longitude']:.5f}",
+                    'risk_level': risk_level,
+                    'speed_limit': f"{max(10, speed)} km/h" if speed > 0 else "25 km/h",
+                    'driver_action': "Avoid peak hours, plan stops",
+                    'latitude': traffic['latitude'],
+                    'longitude': traffic['longitude'],
+                    'priority': 2,
+                    '_rank': (2, _RISK_RANK[risk_level]),
+                    '_source': 'traffic_data'
+                })
             
             return traffic_risks
             
         except Exception as e:
             return []
 
-    def _get_communication_risk_zones(self, route_id: str, route_points: List[Dict]) -> List[Dict]:
+    def _get_communication_risk_zones(self, conn: sqlite3.Connection, route_id: str) -> List[Dict]:
         """Get communication dead zones from database"""
         try:
-            import sqlite3
-            
             comm_risks = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT latitude, longitude, coverage_quality 
-                    FROM network_coverage 
-                    WHERE route_id = ? AND (is_dead_zone = 1 OR coverage_quality = 'dead')
-                """, (route_id,))
-                
-                dead_zones = [dict(row) for row in cursor.fetchall()]
-                
-                for i, zone in enumerate(dead_zones[:2]):  # Top 2 dead zones
-                    dist_from_start, dist_from_end = self._calculate_distances_from_endpoints(
-                        zone['latitude'], zone['longitude'], route_points
-                    )
-                    
-                    comm_risks.append({
-                        'type': f"Communication Dead Zone #{i+1}",
-                        'coordinates': f"{zone['latitude']:.5f}, {zone['longitude']:.5f}",
-                        'risk_level': "High",
-                        'speed_limit': "—",
-                        'driver_action': "Use alternative comms device",
-                        'dist_from_start': dist_from_start,
-                        'dist_from_end': dist_from_end,
-                        'priority': 3
-                    })
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT latitude, longitude, coverage_quality 
+                FROM network_coverage 
+                WHERE route_id = ? AND (is_dead_zone = 1 OR coverage_quality = 'dead')
+                ORDER BY id
+                LIMIT 2
+            """, (route_id,))
+            
+            for i, zone in enumerate(cursor):  # Top 2 dead zones
+                comm_risks.append({
+                    'type': f"Communication Dead Zone #{i+1}",
+                    'coordinates': f"{zone['latitude']:.5f}, {zone['longitude']:.5f}",
+                    'risk_level': "High",
+                    'speed_limit': "—",
+                    'driver_action': "Use alternative comms device",
+                    'latitude': zone['latitude'],
+                    'longitude': zone['longitude'],
+                    'priority': 3,
+                    '_rank': (3, _RISK_RANK['High']),
+                    '_source': 'network_coverage'
+                })
             
             return comm_risks
             
         except Exception as e:
             return []
 
-    def _get_environmental_risk_zones(self, route_id: str, route_points: List[Dict]) -> List[Dict]:
+    def _get_environmental_risk_zones(self, conn: sqlite3.Connection, route_id: str) -> List[Dict]:
         """Get environmental risk zones from database"""
         try:
-            import sqlite3
-            
             env_risks = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT latitude, longitude, risk_type, severity 
-                    FROM environmental_risks 
-                    WHERE route_id = ? AND severity IN ('critical', 'high')
-                    ORDER BY 
-                        CASE severity 
-                            WHEN 'critical' THEN 1 
-                            WHEN 'high' THEN 2 
-                            ELSE 3 
-                        END
-                    LIMIT 2
-                """, (route_id,))
-                
-                env_data = [dict(row) for row in cursor.fetchall()]
-                
-                for i, env in enumerate(env_data):
-                    dist_from_start, dist_from_end = self._calculate_distances_from_endpoints(
-                        env['latitude'], env['longitude'], route_points
-                    )
-                    
-                    risk_type = env.get('risk_type', 'environmental')
-                    severity = env.get('severity', 'medium')
-                    
-                    env_risks.append({
-                        'type': f"{risk_type.replace('_', ' ').title()} Zone",
-                        'coordinates': f"{env['latitude']:.5f}, {env['longitude']:.5f}",
-                        'risk_level': severity.title(),
-                        'speed_limit': "Normal",
-                        'driver_action': "Follow environmental guidelines",
-                        'dist_from_start': dist_from_start,
-                        'dist_from_end': dist_from_end,
-                        'priority': 3
-                    })
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT latitude, longitude, risk_type, severity 
+                FROM environmental_risks 
+                WHERE route_id = ? AND severity IN ('critical', 'high')
+                ORDER BY 
+                    CASE severity 
+                        WHEN 'critical' THEN 1 
+                        WHEN 'high' THEN 2 
+                        ELSE 3 
+                    END,
+                    id
+                LIMIT 2
+            """, (route_id,))
+            
+            for i, env in enumerate(cursor):
+                risk_type = env['risk_type'] or 'environmental'
+                severity = env['severity']
+                risk_level = severity.title()
+                
+                env_risks.append({
+                    'type': f"{risk_type.replace('_', ' ').title()} Zone",
+                    'coordinates': f"{env['latitude']:.5f}, {env['longitude']:.5f}",
+                    'risk_level': risk_level,
+                    'speed_limit': "Normal",
+                    'driver_action': "Follow environmental guidelines",
+                    'latitude': env['latitude'],
+                    'longitude': env['longitude'],
+                    'priority': 3,
+                    '_rank': (3, _RISK_RANK.get(risk_level, 2)),
+                    '_source': 'environmental_risks'
+                })
             
             return env_risks
             
@@ -1751,6 +2182,10 @@ class PDFGenerator:
             pdf.set_draw_color(0, 0, 0)  # Red
             pdf.set_line_width(0.5)
 
+            # Text style is the same for every cell, so set it once for the table
+            pdf.set_text_color(0, 0, 0)
+            pdf.set_font('Helvetica', 'B', 10)
+
             # Draw each row
             for i, row in enumerate(table_data):
                 y_pos = table_start_y + i * row_height
@@ -1761,28 +2196,22 @@ class PDFGenerator:
                 else:
                     pdf.set_fill_color(245, 245, 245)  # Light gray for alternate
 
-                pdf.rect(table_start_x, y_pos, table_width, row_height, 'DF')
+                pdf.rect(table_start_x, y_pos, table_width, row_height, 'F')
 
                 # Draw columns and content
                 x_pos = table_start_x
                 for j, cell in enumerate(row):
-                    pdf.set_text_color(0, 0, 0)
-                    pdf.set_font('Helvetica', 'B', 10)
                     pdf.set_xy(x_pos + 2, y_pos + 3)
-                    pdf.multi_cell(col_widths[j] - 4, 5, str(cell), 0, 'L')
-
-                    # Internal vertical red line (if not last column)
-                    if j < len(row) - 1:
-                        pdf.set_draw_color(0, 0, 0)
-                        pdf.line(x_pos + col_widths[j], y_pos, x_pos + col_widths[j], y_pos + row_height)
-
+                    text = pdf._pdf_text(str(cell))
+                    # Text that fits on one line does not need multi_cell's word-wrapping
+                    if '\n' not in text and self._measure(pdf, text) < col_widths[j] - 4 - 2 * pdf.c_margin:
+                        pdf._raw_cell(col_widths[j] - 4, 5, text, 0, 0, 'L')
+                    else:
+                        pdf.multi_cell(col_widths[j] - 4, 5, text, 0, 'L')
                     x_pos += col_widths[j]
 
-                # Horizontal red line under the row
-                pdf.set_draw_color(0, 0, 0)
-                pdf.line(table_start_x, y_pos + row_height, table_start_x + table_width, y_pos + row_height)
-
-            # Final outer border rectangle
+            # Column and row separators as one path, then the outer border rectangle
+            self._stroke_table_grid(pdf, table_start_x, table_start_y, col_widths, row_height, len(table_data))
             pdf.rect(table_start_x, table_start_y, table_width, len(table_data) * row_height)
 
             # Move cursor below the table
@@ -1844,7 +2273,7 @@ class PDFGenerator:
                             "emergency services, highway junctions, and potential hazards.")
             
             # Wrap and display description
-            wrapped_description = self._wrap_text(map_description, 180)
+            wrapped_description = self._wrap_text(pdf, map_description, 180)
             for line in wrapped_description:
                 pdf.cell(0, 4, line, 0, 1, 'L')
             
@@ -1853,7 +2282,9 @@ class PDFGenerator:
             # Generate and add map image
             route_id = enhanced_data.get('route_info', {}).get('id')
             if route_id:
-                map_image_path = self._generate_enhanced_map_image(enhanced_data)
+                # Downloaded in the background since the overview data was fetched
+                map_future = enhanced_data.pop('_map_future', None)
+                map_image_path = map_future.result() if map_future else self._generate_enhanced_map_image(enhanced_data)
                 if map_image_path:
                     # Calculate image dimensions
                     page_width = pdf.w - 2 * pdf.l_margin
@@ -1864,16 +2295,10 @@ class PDFGenerator:
                     x_pos = (pdf.w - image_width) / 2
                     y_pos = pdf.get_y()
                     
-                    # Add image
+                    # Add image (the file stays in the map cache)
                     try:
                         pdf.image(map_image_path, x_pos, y_pos, image_width, image_height)
                         pdf.set_y(y_pos + image_height + 5)
-                        
-                        # Clean up temporary file
-                        import os
-                        if os.path.exists(map_image_path):
-                            os.unlink(map_image_path)
-                            
                     except Exception as e:
                         print(f"Error adding map image: {e}")
                         self._add_map_placeholder(pdf)
@@ -1930,54 +2355,20 @@ class PDFGenerator:
                 print("Google Maps API key not available for map generation")
                 return None
             
-            # Calculate map center
-            all_lats = [point['latitude'] for point in route_points]
-            all_lngs = [point['longitude'] for point in route_points]
-            center_lat = sum(all_lats) / len(all_lats)
-            center_lng = sum(all_lngs) / len(all_lngs)
+            # Map center and extent in one vectorized pass over the (n, 2) lat/lng array
+            import numpy as np
+            coords = self._route_coords(enhanced_data)
+            center_lat, center_lng = coords.mean(axis=0).tolist()
             
             # Calculate zoom level
-            lat_span = max(all_lats) - min(all_lats)
-            lng_span = max(all_lngs) - min(all_lngs)
-            max_span = max(lat_span, lng_span)
-            
-            if max_span <= 0.05:
-                zoom = 13
-            elif max_span <= 0.1:
-                zoom = 12
-            elif max_span <= 0.2:
-                zoom = 11
-            elif max_span <= 0.5:
-                zoom = 10
-            else:
-                zoom = 9
+            max_span = float(np.ptp(coords, axis=0).max())
+            
+            zoom = _ZOOM_LEVELS[bisect.bisect_left(_ZOOM_THRESHOLDS, max_span)]
             
             # Create route path
             path_points = route_points[::max(1, len(route_points)//40)]  # Sample points
             path_string = '|'.join([f"{point['latitude']},{point['longitude']}" for point in path_points])
             
-            # Build marker strings
-            marker_strings = []
-            marker_count = 0
-            
-            for marker in markers[:40]:  # Limit to 40 markers for URL length
-                if marker_count >= 40:
-                    break
-                    
-                color = marker.get('icon', 'red')
-                label = marker.get('label', '')
-                size = marker.get('size', 'small')
-                lat = marker.get('latitude', 0)
-                lng = marker.get('longitude', 0)
-                
-                marker_string = f"color:{color}|size:{size}"
-                if label:
-                    marker_string += f"|label:{label}"
-                marker_string += f"|{lat},{lng}"
-                
-                marker_strings.append(marker_string)
-                marker_count += 1
-            
             # Build Static Maps URL
             base_url = "https://maps.googleapis.com/maps/api/staticmap"
             params = [
@@ -1989,24 +2380,51 @@ class PDFGenerator:
                 f"path=color:0x0000ff|weight:3|{path_string}"
             ]
             
-            # Add markers
-            for marker_string in marker_strings:
-                params.append(f"markers={marker_string}")
+            # Add markers, each as one joined parameter
+            for marker in markers[:40]:  # Limit to 40 markers for URL length
+                parts = [f"color:{marker.get('icon', 'red')}", f"size:{marker.get('size', 'small')}"]
+                label = marker.get('label', '')
+                if label:
+                    parts.append(f"label:{label}")
+                parts.append(f"{marker.get('latitude', 0)},{marker.get('longitude', 0)}")
+                params.append("markers=" + "|".join(parts))
             
-            final_url = f"{base_url}?" + "&".join(params)
+            final_url = f"{base_url}?{'&'.join(params)}"
             
-            # Download and save image
+            # An unchanged route renders the same URL, so reuse its earlier download
+            cache_path = os.path.join(self.map_cache_path,
+                                      f"rt_map_{hashlib.sha1(final_url.encode()).hexdigest()}.png")
+            try:
+                if os.path.getsize(cache_path) > 0:
+                    os.utime(cache_path)
+                    return cache_path
+            except OSError:
+                pass
+            
+            # Download and stream the image into a partial file, renamed into place when complete
+            part_path = None
             try:
-                import requests
-                response = requests.get(final_url, timeout=30)
-                if response.status_code == 200:
-                    # Save to temporary file
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-                        temp_file.write(response.content)
-                        return temp_file.name
+                with self._http_session().get(final_url, timeout=30, stream=True) as response:
+                    if response.status_code == 200:
+                        os.makedirs(self.map_cache_path, exist_ok=True)
+                        with tempfile.NamedTemporaryFile(dir=self.map_cache_path, delete=False,
+                                                         suffix='.part') as temp_file:
+                            part_path = temp_file.name
+                            # 64 KiB chunks, decoded by requests if the response is compressed
+                            for chunk in response.iter_content(chunk_size=64 * 1024):
+                                temp_file.write(chunk)
+                        os.replace(part_path, cache_path)
+                        part_path = None
+                        self._evict_map_cache()
+                        return cache_path
             except Exception as e:
                 print(f"Error downloading map image: {e}")
+            finally:
+                if part_path:
+                    try:
+                        os.unlink(part_path)
+                    except OSError:
+                        pass
             
             return None
             
@@ -2014,6 +2432,35 @@ class PDFGenerator:
             print(f"Error generating enhanced map image: {e}")
             return None
 
+    def _evict_map_cache(self) -> None:
+        """Delete all but the _MAP_CACHE_LIMIT most recently used cached static maps"""
+        try:
+            entries = []
+            with os.scandir(self.map_cache_path) as it:
+                for entry in it:
+                    if entry.name.startswith('rt_map_') and entry.name.endswith('.png'):
+                        entries.append((entry.stat().st_mtime, entry.path))
+            if len(entries) <= self._MAP_CACHE_LIMIT:
+                return
+            entries.sort(reverse=True)
+            for _, path in entries[self._MAP_CACHE_LIMIT:]:
+                os.unlink(path)
+        except OSError as e:
+            print(f"Error trimming map cache: {e}")
+
+    def _http_session(self):
+        """Pooled requests session for map downloads, shared by all reports of this generator"""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+                    session.headers['User-Agent'] = 'RouteAnalyticsPro/2.0'
+                    self._http = session
+        return self._http
+
     def _add_map_placeholder(self, pdf: 'EnhancedRoutePDF') -> None:
         """Add placeholder when map cannot be generated"""
         try:
@@ -2051,24 +2498,11 @@ class PDFGenerator:
             pdf.cell(0, 6, 'MAP LEGEND', 0, 1, 'L')
             pdf.ln(2)
             
-            # Legend items
-            legend_items = [
-                ('A', 'Route Start Point'),
-                ('B', 'Route End Point'),
-                ('T#', 'Critical Sharp Turns'),
-                ('H', 'Hospitals'),
-                ('P', 'Police Stations'),
-                ('F', 'Fire Stations'),
-                ('G', 'Gas Stations'),
-                ('S', 'Schools/Education'),
-                ('*', 'Highway Junctions')
-            ]
-            
             # Display legend in two columns
             pdf.set_font('Helvetica', '', 9)
             col_width = 90
             
-            for i, (icon, description) in enumerate(legend_items):
+            for i, (icon, description) in enumerate(self._MAP_LEGEND_ITEMS):
                 if i % 2 == 0:
                     # Left column
                     x_pos = pdf.l_margin
@@ -2093,24 +2527,27 @@ class PDFGenerator:
         except Exception as e:
             print(f"Error adding map legend: {e}")
 
-    def _wrap_text(self, text: str, max_width: float) -> List[str]:
-        """Wrap text to fit within specified width"""
-        words = text.split()
+    def _wrap_text(self, pdf: 'EnhancedRoutePDF', text: str, max_width: float) -> List[str]:
+        """Wrap text to fit within specified width, measured in the current font"""
+        space_width = self._measure(pdf, ' ')
         lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            # Approximate character width (this is rough estimation)
-            if len(test_line) * 2.5 <= max_width:
-                current_line = test_line
+        current_words = []
+        current_width = 0
+        
+        for word in pdf._pdf_text(text).split():
+            word_width = self._measure(pdf, word)
+            new_width = current_width + space_width + word_width if current_words else word_width
+            if new_width <= max_width:
+                current_words.append(word)
+                current_width = new_width
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+                if current_words:
+                    lines.append(' '.join(current_words))
+                current_words = [word]
+                current_width = word_width
         
-        if current_line:
-            lines.append(current_line)
+        if current_words:
+            lines.append(' '.join(current_words))
         
         return lines
 
@@ -2202,6 +2639,9 @@ class PDFGenerator:
             pdf.set_draw_color(0, 0, 0)  # Red borders
             pdf.set_line_width(0.5)
             
+            # Text is black in every row; only the font changes after the header
+            pdf.set_text_color(0, 0, 0)
+            
             # Draw each row
             for i, row in enumerate(table_data):
                 y_pos = table_start_y + i * row_height
@@ -2209,51 +2649,34 @@ class PDFGenerator:
                 # Header row special styling
                 if i == 0:
                     pdf.set_fill_color(173, 216, 230)   # HPCL blue header
-                    pdf.set_text_color(0, 0, 0)  # White text
                     pdf.set_font('Helvetica', 'B', 10)
                 else:
+                    if i == 1:
+                        pdf.set_font('Helvetica', 'B', 8)
+                    
                     # Alternating row background
                     if i % 2 == 1:
                         pdf.set_fill_color(255, 255, 255)  # White
                     else:
                         pdf.set_fill_color(245, 245, 245)  # Light gray
-                    
-                    # Color coding based on season
-                    season = conditions_data[i-1].get('season', '').lower() if i <= len(conditions_data) else ''
-                    if 'summer' in season:
-                        pdf.set_text_color(0, 0, 0)  # Orange
-                    elif 'monsoon' in season:
-                        pdf.set_text_color(0, 0, 0)  # Blue
-                    elif 'winter' in season:
-                        pdf.set_text_color(0, 0, 0)  # Blue-gray
-                    elif 'congestion' in season:
-                        pdf.set_text_color(0, 0, 0)  # Red
-                    else:
-                        pdf.set_text_color(0, 0, 0)  # Black
-                    
-                    pdf.set_font('Helvetica', 'B', 8)
                 
-                # Draw row background
-                pdf.rect(table_start_x, y_pos, table_width, row_height, 'DF')
+                # Draw row background (grid is stroked once after the loop)
+                pdf.rect(table_start_x, y_pos, table_width, row_height, 'F')
                 
                 # Draw columns and content
                 x_pos = table_start_x
                 for j, cell in enumerate(row):
                     pdf.set_xy(x_pos + 2, y_pos + 2)
-                    pdf.multi_cell(col_widths[j] - 4, 4, str(cell), 0, 'L')
-                    
-                    # Internal vertical red line (if not last column)
-                    if j < len(row) - 1:
-                        pdf.set_draw_color(0, 0, 0)
-                        pdf.line(x_pos + col_widths[j], y_pos, x_pos + col_widths[j], y_pos + row_height)
-                    
+                    text = pdf._pdf_text(str(cell))
+                    # Text that fits on one line does not need multi_cell's word-wrapping
+                    if '\n' not in text and self._measure(pdf, text) < col_widths[j] - 4 - 2 * pdf.c_margin:
+                        pdf._raw_cell(col_widths[j] - 4, 4, text, 0, 0, 'L')
+                    else:
+                        pdf.multi_cell(col_widths[j] - 4, 4, text, 0, 'L')
                     x_pos += col_widths[j]
-                
-                # Horizontal red line under the row
-                pdf.set_draw_color(0, 0, 0)
-                pdf.line(table_start_x, y_pos + row_height, table_start_x + table_width, y_pos + row_height)
             
-            # Final outer border rectangle
+            # Column and row separators as one path, then the outer border rectangle
+            self._stroke_table_grid(pdf, table_start_x, table_start_y, col_widths, row_height, len(table_data))
             pdf.rect(table_start_x, table_start_y, table_width, len(table_data) * row_height)
             
             # Move cursor below the table
@@ -2276,12 +2699,15 @@ class PDFGenerator:
             highways = highway_data.get('highways', []) if not highway_data.get('error') else []
             terrain_type = terrain_data.get('terrain_type', 'Mixed') if not terrain_data.get('error') else 'Mixed'
             
+            # Traffic, elevation and school rows of the table, read in one query
+            db_rows = self._seasonal_db_fetch(route_id)
+            
             # 1. SUMMER CONDITIONS based on actual highways and terrain
             summer_conditions = self._get_summer_conditions(highways, terrain_type, route_points)
             seasonal_conditions.extend(summer_conditions)
             
             # 2. MONSOON CONDITIONS based on terrain and elevation
-            monsoon_conditions = self._get_monsoon_conditions(route_id, highways, terrain_type, route_points)
+            monsoon_conditions = self._get_monsoon_conditions(db_rows['elevation'], highways, terrain_type, route_points)
             seasonal_conditions.extend(monsoon_conditions)
             
             # 3. WINTER CONDITIONS based on elevation and terrain
@@ -2289,11 +2715,11 @@ class PDFGenerator:
             seasonal_conditions.extend(winter_conditions)
             
             # 4. HIGH CONGESTION AREAS from traffic data
-            congestion_conditions = self._get_congestion_conditions(route_id, route_points)
+            congestion_conditions = self._get_congestion_conditions(db_rows['traffic'])
             seasonal_conditions.extend(congestion_conditions)
             
             # 5. SCHOOL ZONES from POI data
-            school_conditions = self._get_school_zone_conditions(route_id, route_points)
+            school_conditions = self._get_school_zone_conditions(db_rows['school'])
             seasonal_conditions.extend(school_conditions)
             
             # 6. TOLL PLAZAS from highway data
@@ -2306,6 +2732,37 @@ class PDFGenerator:
             print(f"Error compiling seasonal conditions: {e}")
             return []
 
+    def _seasonal_db_fetch(self, route_id: str) -> Dict[str, List[Dict]]:
+        """Heavy-traffic, highest-elevation and school rows for the seasonal table, in one UNION ALL query"""
+        rows = {source: [] for source in self._SEASONAL_VALUE_FIELDS}
+        try:
+            with self._conn() as conn:
+                selects = [select for table, select in self._SEASONAL_QUERIES.values()
+                           if self._table_exists(conn, table)]
+                if not selects:
+                    return rows
+                
+                try:
+                    results = conn.execute(
+                        " UNION ALL ".join(f"SELECT * FROM ({select})" for select in selects),
+                        (route_id,) * len(selects)).fetchall()
+                except sqlite3.Error as e:
+                    # One unreadable source must not hide the others: read them one by one
+                    print(f"Seasonal condition query failed, reading sources separately: {e}")
+                    results = []
+                    for select in selects:
+                        try:
+                            results.extend(conn.execute(select, (route_id,)))
+                        except sqlite3.Error as e:
+                            print(f"Error reading seasonal condition data: {e}")
+                
+                for source, lat, lng, value in results:
+                    rows[source].append({'latitude': lat, 'longitude': lng,
+                                         self._SEASONAL_VALUE_FIELDS[source]: value})
+        except Exception as e:
+            print(f"Error reading seasonal condition data: {e}")
+        return rows
+
     def _get_summer_conditions(self, highways: List[Dict], terrain_type: str, route_points: List[Dict]) -> List[Dict]:
         """Get summer-specific conditions based on route"""
         summer_conditions = []
@@ -2345,12 +2802,12 @@ class PDFGenerator:
         
         return summer_conditions
 
-    def _get_monsoon_conditions(self, route_id: str, highways: List[Dict], terrain_type: str, route_points: List[Dict]) -> List[Dict]:
+    def _get_monsoon_conditions(self, elevation_rows: List[Dict], highways: List[Dict], terrain_type: str, route_points: List[Dict]) -> List[Dict]:
         """Get monsoon-specific conditions"""
         monsoon_conditions = []
         
         # Check for elevation changes (ghat sections)
-        elevation_risks = self._get_elevation_monsoon_risks(route_id, route_points)
+        elevation_risks = self._get_elevation_monsoon_risks(elevation_rows)
         monsoon_conditions.extend(elevation_risks)
         
         # Highway-specific monsoon risks
@@ -2409,48 +2866,33 @@ class PDFGenerator:
         
         return winter_conditions
 
-    def _get_congestion_conditions(self, route_id: str, route_points: List[Dict]) -> List[Dict]:
-        """Get high congestion area conditions from traffic data"""
+    def _get_congestion_conditions(self, traffic_rows: List[Dict]) -> List[Dict]:
+        """Get high congestion area conditions from heavy-traffic rows"""
         try:
-            import sqlite3
-            
             congestion_conditions = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT latitude, longitude, congestion_level, current_speed
-                    FROM traffic_data 
-                    WHERE route_id = ? AND congestion_level = 'HEAVY'
-                    LIMIT 3
-                """, (route_id,))
-                
-                traffic_data = [dict(row) for row in cursor.fetchall()]
+            
+            for i, traffic in enumerate(traffic_rows):
+                coords = f"{traffic['latitude']:.1f}, {traffic['longitude']:.1f}"
+                speed = traffic.get('current_speed', 25)
                 
-                for i, traffic in enumerate(traffic_data):
-                    coords = f"{traffic['latitude']:.1f}, {traffic['longitude']:.1f}"
-                    speed = traffic.get('current_speed', 25)
-                    
-                    congestion_conditions.append({
-                        'season': 'High Congestion Areas',
-                        'critical_stretches': f"Congestion zone {i+1} ({coords})",
-                        'typical_challenges': f"Urban congestion, slow traffic during peak hours (avg: {speed} km/h)",
-                        'driver_caution': "Avoid peak hours, plan safe stops, maintain patience"
-                    })
+                congestion_conditions.append({
+                    'season': 'High Congestion Areas',
+                    'critical_stretches': f"Congestion zone {i+1} ({coords})",
+                    'typical_challenges': f"Urban congestion, slow traffic during peak hours (avg: {speed} km/h)",
+                    'driver_caution': "Avoid peak hours, plan safe stops, maintain patience"
+                })
             
             return congestion_conditions
             
         except Exception as e:
             return []
 
-    def _get_school_zone_conditions(self, route_id: str, route_points: List[Dict]) -> List[Dict]:
-        """Get school zone conditions from POI data"""
+    def _get_school_zone_conditions(self, school_rows: List[Dict]) -> List[Dict]:
+        """Get school zone conditions from school POI rows"""
         try:
             school_conditions = []
-            schools = self.db_manager.get_pois_by_type(route_id, 'school')
             
-            for i, school in enumerate(schools[:3]):  # Top 3 schools
+            for i, school in enumerate(school_rows):  # Top 3 schools
                 if school.get('latitude', 0) != 0 and school.get('longitude', 0) != 0:
                     coords = f"{school['latitude']:.1f}, {school['longitude']:.1f}"
                     school_name = school.get('name', f'School {i+1}')
@@ -2490,36 +2932,21 @@ class PDFGenerator:
         
         return toll_conditions[:2]  # Limit to 2 toll plazas
 
-    def _get_elevation_monsoon_risks(self, route_id: str, route_points: List[Dict]) -> List[Dict]:
-        """Get monsoon-specific elevation risks"""
+    def _get_elevation_monsoon_risks(self, elevation_rows: List[Dict]) -> List[Dict]:
+        """Get monsoon-specific elevation risks from the highest elevation rows"""
         try:
-            import sqlite3
-            
             elevation_risks = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT latitude, longitude, elevation 
-                    FROM elevation_data 
-                    WHERE route_id = ? 
-                    ORDER BY elevation DESC
-                    LIMIT 3
-                """, (route_id,))
-                
-                elevation_data = [dict(row) for row in cursor.fetchall()]
-                
-                for i, elev in enumerate(elevation_data):
-                    if elev['elevation'] > 500:  # Elevated areas
-                        coords = f"{elev['latitude']:.1f}, {elev['longitude']:.1f}"
-                        
-                        elevation_risks.append({
-                            'season': 'Monsoon',
-                            'critical_stretches': f"Elevated section {i+1} ({coords}) - {elev['elevation']:.0f}m elevation",
-                            'typical_challenges': "Landslide risk, water accumulation, steep gradients",
-                            'driver_caution': "Extra slow speed, avoid stopping on slopes, check weather updates"
-                        })
+            
+            for i, elev in enumerate(elevation_rows):
+                if elev['elevation'] > 500:  # Elevated areas
+                    coords = f"{elev['latitude']:.1f}, {elev['longitude']:.1f}"
+                    
+                    elevation_risks.append({
+                        'season': 'Monsoon',
+                        'critical_stretches': f"Elevated section {i+1} ({coords}) - {elev['elevation']:.0f}m elevation",
+                        'typical_challenges': "Landslide risk, water accumulation, steep gradients",
+                        'driver_caution': "Extra slow speed, avoid stopping on slopes, check weather updates"
+                    })
             
             return elevation_risks
             
@@ -2528,18 +2955,7 @@ class PDFGenerator:
 
     def _get_current_season(self) -> str:
         """Get current season based on date"""
-        import datetime
-        
-        month = datetime.datetime.now().month
-        
-        if month in [12, 1, 2]:
-            return "Winter"
-        elif month in [3, 4, 5]:
-            return "Summer"
-        elif month in [6, 7, 8, 9]:
-            return "Monsoon"
-        else:
-            return "Post-Monsoon"
+        return self._MONTH_TO_SEASON[datetime.date.today().month - 1]
     def _add_environmental_considerations_table(self, pdf: 'EnhancedRoutePDF', enhanced_data: Dict, route_id: str) -> None:
         """Add Environmental & Local Considerations table with enhanced red-bordered styling"""
         try:
@@ -2601,6 +3017,9 @@ class PDFGenerator:
             pdf.set_draw_color(0, 0, 0)  # Red borders
             pdf.set_line_width(0.5)
             
+            # Text is black in every row; only the font changes after the header
+            pdf.set_text_color(0, 0, 0)
+            
             # Draw each row
             for i, row in enumerate(table_data):
                 y_pos = table_start_y + i * row_height
@@ -2608,49 +3027,34 @@ class PDFGenerator:
                 # Header row special styling
                 if i == 0:
                     pdf.set_fill_color(173, 216, 230)   # HPCL blue header
-                    pdf.set_text_color(0, 0, 0)  # White text
                     pdf.set_font('Helvetica', 'B', 10)
                 else:
+                    if i == 1:
+                        pdf.set_font('Helvetica', 'B', 8)
+                    
                     # Alternating row background
                     if i % 2 == 1:
                         pdf.set_fill_color(255, 255, 255)  # White
                     else:
                         pdf.set_fill_color(245, 245, 245)  # Light gray
-                    
-                    # Color coding based on zone type
-                    zone_type = zones_data[i-1].get('zone_type', '').lower() if i <= len(zones_data) else ''
-                    if 'eco-sensitive' in zone_type:
-                        pdf.set_text_color(0, 0, 0)  # Green
-                    elif 'school' in zone_type:
-                        pdf.set_text_color(0, 0, 0)  # Orange
-                    elif 'market' in zone_type:
-                        pdf.set_text_color(0, 0, 0)  # Purple
-                    else:
-                        pdf.set_text_color(0, 0, 0)  # Black
-                    
-                    pdf.set_font('Helvetica', 'B', 8)
                 
-                # Draw row background
-                pdf.rect(table_start_x, y_pos, table_width, row_height, 'DF')
+                # Draw row background (grid is stroked once after the loop)
+                pdf.rect(table_start_x, y_pos, table_width, row_height, 'F')
                 
                 # Draw columns and content
                 x_pos = table_start_x
                 for j, cell in enumerate(row):
                     pdf.set_xy(x_pos + 2, y_pos + 2)
-                    pdf.multi_cell(col_widths[j] - 4, 4, str(cell), 0, 'L')
-                    
-                    # Internal vertical red line (if not last column)
-                    if j < len(row) - 1:
-                        pdf.set_draw_color(0, 0, 0)
-                        pdf.line(x_pos + col_widths[j], y_pos, x_pos + col_widths[j], y_pos + row_height)
-                    
+                    text = pdf._pdf_text(str(cell))
+                    # Text that fits on one line does not need multi_cell's word-wrapping
+                    if '\n' not in text and self._measure(pdf, text) < col_widths[j] - 4 - 2 * pdf.c_margin:
+                        pdf._raw_cell(col_widths[j] - 4, 4, text, 0, 0, 'L')
+                    else:
+                        pdf.multi_cell(col_widths[j] - 4, 4, text, 0, 'L')
                     x_pos += col_widths[j]
-                
-                # Horizontal red line under the row
-                pdf.set_draw_color(0, 0, 0)
-                pdf.line(table_start_x, y_pos + row_height, table_start_x + table_width, y_pos + row_height)
             
-            # Final outer border rectangle
+            # Column and row separators as one path, then the outer border rectangle
+            self._stroke_table_grid(pdf, table_start_x, table_start_y, col_widths, row_height, len(table_data))
             pdf.rect(table_start_x, table_start_y, table_width, len(table_data) * row_height)
             
             # Move cursor below the table
@@ -2717,11 +3121,8 @@ class PDFGenerator:
     def _get_eco_sensitive_zones(self, route_id: str, highways: List[Dict], route_points: List[Dict]) -> List[Dict]:
         """Get eco-sensitive zones from environmental database"""
         try:
-            import sqlite3
-            
             eco_zones = []
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 # Get eco-sensitive areas from environmental risks table
@@ -2729,6 +3130,7 @@ class PDFGenerator:
                     SELECT latitude, longitude, risk_type, description
                     FROM environmental_risks 
                     WHERE route_id = ? AND risk_category = 'ecological'
+                    ORDER BY id
                     LIMIT 3
                 """, (route_id,))
                 
@@ -2773,13 +3175,10 @@ class PDFGenerator:
     def _get_waterbody_crossings(self, route_id: str, highways: List[Dict], route_points: List[Dict]) -> List[Dict]:
         """Get waterbody crossings from elevation and geographical data"""
         try:
-            import sqlite3
-            
             waterbody_zones = []
             
             # Look for significant elevation dips (potential river crossings)
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -2940,6 +3339,7 @@ class PDFGenerator:
         
         min_distance = float('inf')
         nearest_highway = "Route section"
+        origin = self._prep_haversine(lat, lng)
         
         for highway in highways:
             # Calculate distance to highway start point
@@ -2947,7 +3347,7 @@ class PDFGenerator:
             h_lng = highway.get('start_longitude', 0)
             
             if h_lat and h_lng:
-                distance = self._calculate_distance_km([lat, lng], [h_lat, h_lng])
+                distance = self._haversine_from_prep(h_lat, h_lng, origin)
                 if distance < min_distance:
                     min_distance = distance
                     nearest_highway = highway.get('highway_name', 'Route section')
@@ -2968,16 +3368,14 @@ class PDFGenerator:
             
             cluster = [poi]
             used_pois.add(poi['id'])
+            center = self._prep_haversine(poi['latitude'], poi['longitude'])
             
             # Find nearby POIs within 500m
             for other_poi in pois:
                 if (other_poi['id'] not in used_pois and 
                     other_poi.get('latitude', 0) != 0 and other_poi.get('longitude', 0) != 0):
                     
-                    distance = self._calculate_distance_km(
-                        [poi['latitude'], poi['longitude']],
-                        [other_poi['latitude'], other_poi['longitude']]
-                    )
+                    distance = self._haversine_from_prep(other_poi['latitude'], other_poi['longitude'], center)
                     
                     if distance < 0.5:  # Within 500m
                         cluster.append(other_poi)
@@ -3135,9 +3533,11 @@ class PDFGenerator:
                 else:
                     pdf.set_fill_color(255, 255, 255)  # White
                 
-                # Calculate row height based on content
-                aspect_lines = self._wrap_text(row[0], col_widths[0] - 4)
-                guidelines_lines = self._wrap_text(row[1], col_widths[1] - 4)
+                # Calculate row height based on content, measured in each column's font
+                pdf.set_font('Helvetica', 'B', 9)
+                aspect_lines = self._wrap_text(pdf, row[0], col_widths[0] - 4)
+                pdf.set_font('Helvetica', '', 8)
+                guidelines_lines = self._wrap_text(pdf, row[1], col_widths[1] - 4)
                 lines_needed = max(len(aspect_lines), len(guidelines_lines))
                 actual_row_height = max(row_height, lines_needed * 4 + 2)
                 
@@ -3180,7 +3580,7 @@ class PDFGenerator:
         """Add comprehensive sharp turns analysis page with BOTH street view AND satellite visual evidence"""
         
         # Get turns data with images
-        turns_data = self.get_turns_with_images(route_id)
+        turns_data = self._page_data('turns', route_id)
         
         if not turns_data:
             pdf.add_page()
@@ -3194,10 +3594,12 @@ class PDFGenerator:
         
         # Comprehensive summary statistics
         total_turns = len(turns_data)
-        extreme_turns = len([t for t in turns_data if t['angle'] >= 90])
-        blind_spots = len([t for t in turns_data if 80 <= t['angle'] < 90])
-        sharp_danger = len([t for t in turns_data if 70 <= t['angle'] < 80])
-        moderate_turns = len([t for t in turns_data if 45 <= t['angle'] < 70])
+        # One pass: tier 4 = >=90, 3 = 80-90, 2 = 70-80, 1 = 45-70 degrees
+        tier_counts = Counter(bisect.bisect_right((45, 70, 80, 90), t['angle']) for t in turns_data)
+        extreme_turns = tier_counts[4]
+        blind_spots = tier_counts[3]
+        sharp_danger = tier_counts[2]
+        moderate_turns = tier_counts[1]
         
         # Get stored images count - UPDATED to show both types
         street_view_count = len(self.get_stored_images_from_db(route_id, 'street_view'))
@@ -3373,7 +3775,7 @@ class PDFGenerator:
                         
                         # Add street view image (left side)
                         pdf.set_xy(15, current_y)
-                        pdf.image(image_path, x=15, y=current_y, w=85, h=65)
+                        pdf.image(self._prepare_image_for_embed(image_path, (502, 384)), x=15, y=current_y, w=85, h=65)
                         
                         # Add street view analysis text (below street view image)
                         pdf.set_xy(15, current_y + 68)
@@ -3410,7 +3812,7 @@ class PDFGenerator:
                     try:
                         # Add satellite image (right side, same Y as street view)
                         pdf.set_xy(110, current_y)
-                        pdf.image(satellite_path, x=110, y=current_y, w=85, h=65)
+                        pdf.image(self._prepare_image_for_embed(satellite_path, (502, 384)), x=110, y=current_y, w=85, h=65)
                         
                         # Add satellite analysis text (below satellite image)
                         pdf.set_xy(110, current_y + 68)
@@ -3464,9 +3866,7 @@ class PDFGenerator:
 
     def _add_enhanced_pois_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add comprehensive Points of Interest analysis with full multi-line tables"""
-        from api.route_api import RouteAPI
-        route_api = RouteAPI(self.db_manager, None)
-        pois_data = route_api.get_points_of_interest(route_id)
+        pois_data = self._page_data('pois', route_id)
         
         if 'error' in pois_data:
             pdf.add_page()
@@ -3614,12 +4014,11 @@ class PDFGenerator:
             else:
                 pdf.cell(width - 4, header_height - 4, header, 0, 0, 'C')
             
-            # Vertical border line
-            if i < len(headers) - 1:
-                pdf.line(x_pos + width, current_y, x_pos + width, current_y + header_height)
-            
             x_pos += width
         
+        # Vertical border lines as one path
+        self._stroke_table_grid(pdf, current_x, current_y, col_widths, header_height, 1)
+        
         pdf.set_y(current_y + header_height)
 
     def _create_multiline_table_row(self, pdf: 'EnhancedRoutePDF', row_data: list, col_widths: list):
@@ -3664,12 +4063,11 @@ class PDFGenerator:
             else:
                 self._draw_multiline_text_cell(pdf, str(cell_content), x_pos, current_y, width, row_height)
             
-            # Draw vertical border
-            if i < len(row_data) - 1:
-                pdf.line(x_pos + width, current_y, x_pos + width, current_y + row_height)
-            
             x_pos += width
         
+        # Vertical borders as one path
+        self._stroke_table_grid(pdf, current_x, current_y, col_widths[:len(row_data)], row_height, 1)
+        
         pdf.set_y(current_y + row_height)
 
     def _calculate_required_row_height(self, pdf: 'EnhancedRoutePDF', row_data: list, col_widths: list) -> float:
@@ -3902,6 +4300,12 @@ class PDFGenerator:
             print(f"Error generating map link: {e}")
             return "Not available"
 
+    @staticmethod
+    def _ellipsize(text: Optional[str], default: str, limit: int = 40) -> str:
+        """First limit characters plus '...' for long text, default when empty"""
+        text = text or default
+        return text[:limit] + '...' if len(text) > limit else text
+
     def _truncate_text(self, text: str, max_length: int) -> str:
         """Truncate text to fit in PDF table cells"""
         if not text:
@@ -4059,9 +4463,7 @@ class PDFGenerator:
         return self._add_enhanced_pois_page(pdf, route_id)
     def _add_network_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add comprehensive network coverage analysis"""
-        from api.route_api import RouteAPI
-        route_api = RouteAPI(self.db_manager, None)
-        network_data = route_api.get_network_coverage(route_id)
+        network_data = self._page_data('network', route_id)
         
         if 'error' in network_data:
             pdf.add_page()
@@ -4238,9 +4640,7 @@ class PDFGenerator:
     
     def _add_weather_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add comprehensive weather analysis"""
-        from api.route_api import RouteAPI
-        route_api = RouteAPI(self.db_manager, None)
-        weather_data = route_api.get_weather_data(route_id)
+        weather_data = self._page_data('weather', route_id)
         
         if 'error' in weather_data:
             pdf.add_page()
@@ -4408,9 +4808,7 @@ class PDFGenerator:
     
     def _add_compliance_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add detailed regulatory compliance analysis"""
-        from api.route_api import RouteAPI
-        route_api = RouteAPI(self.db_manager, None)
-        compliance_data = route_api.get_compliance_data(route_id)
+        compliance_data = self._page_data('compliance', route_id)
         
         if 'error' in compliance_data:
             pdf.add_page()
@@ -4452,6 +4850,7 @@ class PDFGenerator:
         pdf.set_text_color(0, 0, 0)
         vehicle_info = compliance_data['vehicle_info']
         route_analysis = compliance_data['route_analysis']
+        route = self._get_route(route_id)
         
         pdf.set_font('Helvetica', 'B', 12)
         pdf.set_text_color(*self.primary_color)
@@ -4462,8 +4861,8 @@ class PDFGenerator:
             ['Vehicle Category', vehicle_info['category']],
             ['Vehicle Weight Classification', f"{vehicle_info['weight']:,} kg"],
             ['AIS-140 GPS Tracking Required', 'YES (Mandatory)' if vehicle_info['ais_140_required'] else 'NO (Not Required)'],
-            ['Route Origin', route_analysis['from_address'][:50]],
-            ['Route Destination', route_analysis['to_address'][:50]],
+            ['Route Origin', route['_from_short']],
+            ['Route Destination', route['_to_short']],
             ['Total Route Distance', route_analysis['distance']],
             ['Estimated Travel Duration', route_analysis['duration']],
             ['Interstate Travel', 'YES' if 'km' in route_analysis.get('distance', '') and int(''.join(filter(str.isdigit, route_analysis.get('distance', '0')))) > 500 else 'NO']
@@ -4574,9 +4973,7 @@ class PDFGenerator:
     
     def _add_elevation_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add comprehensive elevation analysis with real Google API data"""
-        from api.route_api import RouteAPI
-        route_api = RouteAPI(self.db_manager, None)
-        elevation_data = route_api.get_elevation_data(route_id)
+        elevation_data = self._page_data('elevation', route_id)
         
         pdf.add_page()
         pdf.add_section_header("COMPREHENSIVE ELEVATION & TERRAIN ANALYSIS", "success")
@@ -4802,23 +5199,18 @@ class PDFGenerator:
             pdf.cell(0, 6, "* Normal fuel consumption expected", 0, 1, 'L')
             pdf.cell(0, 6, "* Standard fuel planning adequate", 0, 1, 'L')
         
-        pdf.cell(0, 6, f"* Total ascent sections identified: {len([c for c in changes if c['type'] == 'ascent'])}", 0, 1, 'L')
-        pdf.cell(0, 6, f"* Total descent sections identified: {len([c for c in changes if c['type'] == 'descent'])}", 0, 1, 'L')
+        change_counts = Counter(c['type'] for c in changes)
+        pdf.cell(0, 6, f"* Total ascent sections identified: {change_counts['ascent']}", 0, 1, 'L')
+        pdf.cell(0, 6, f"* Total descent sections identified: {change_counts['descent']}", 0, 1, 'L')
     
     # Fixed emergency page method for pdf_generator.py
     # Replace your existing _add_emergency_page method with this improved version
 
     def _add_emergency_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add comprehensive emergency preparedness analysis with REAL DATA - FIXED VERSION"""
-        from api.route_api import RouteAPI
-        route_api = RouteAPI(self.db_manager, None)
         
-        # Try to get emergency data from the new emergency analyzer
-        emergency_data = self._get_emergency_data_from_db(route_id)
-        
-        # Fallback to the old method if new data not available
-        if not emergency_data:
-            emergency_data = route_api.get_emergency_data(route_id)
+        # Emergency analyzer data, or the old RouteAPI summary when not available
+        emergency_data = self._page_data('emergency', route_id)
         
         if 'error' in emergency_data:
             pdf.add_page()
@@ -5105,15 +5497,11 @@ class PDFGenerator:
     def _get_emergency_data_from_db(self, route_id: str) -> Dict:
         """Get emergency data from the new emergency analyzer database"""
         try:
-            import sqlite3
-            
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 # Check if emergency analysis table exists
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='emergency_analysis'")
-                if not cursor.fetchone():
+                if not self._table_exists(conn, 'emergency_analysis'):
                     return {}
                 
                 cursor.execute("SELECT * FROM emergency_analysis WHERE route_id = ?", (route_id,))
@@ -5184,7 +5572,7 @@ class PDFGenerator:
     def _add_route_map_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add comprehensive route map with FIXED legend table layout"""
         
-        route_maps = self.get_stored_images_from_db(route_id, 'route_map')
+        route_maps = self._page_data('route_map', route_id)
         pdf.add_page()
         pdf.add_section_header("COMPREHENSIVE ROUTE MAP WITH ALL CRITICAL POINTS", "info")
         
@@ -5197,7 +5585,7 @@ class PDFGenerator:
                     pdf.set_text_color(*self.primary_color)
                     pdf.cell(0, 8, 'COMPREHENSIVE ROUTE VISUALIZATION', 0, 1, 'C')
                     pdf.ln(5)
-                    pdf.image(image_path, x=10, y=pdf.get_y(), w=190, h=130)
+                    pdf.image(self._prepare_image_for_embed(image_path), x=10, y=pdf.get_y(), w=190, h=130)
                     pdf.set_y(pdf.get_y() + 135)
                     
                     pdf.set_font('Helvetica', 'B', 11)
@@ -5213,12 +5601,13 @@ class PDFGenerator:
                     pdf.set_text_color(*self.danger_color)
                     pdf.cell(0, 6, 'CRITICAL SAFETY MARKERS:', 0, 1, 'L')
                     
+                    # Data rows carry their precomputed row height (8 when any cell exceeds width // 3 chars)
                     safety_legend = [
                         ['SYMBOL', 'COLOR', 'MEANING', 'ACTION REQUIRED'],
-                        ['T1-T15', 'RED', 'Sharp Turns (>=70 deg)', 'Reduce speed, extreme caution'],
-                        ['D', 'PURPLE', 'Network Dead Zones', 'Use satellite communication'],
-                        ['T', 'ORANGE', 'Heavy Traffic Areas', 'Allow extra travel time'],
-                        ['—', 'BLUE', 'Complete Route Path', 'Follow GPS navigation']
+                        (['T1-T15', 'RED', 'Sharp Turns (>=70 deg)', 'Reduce speed, extreme caution'], 8),
+                        (['D', 'PURPLE', 'Network Dead Zones', 'Use satellite communication'], 8),
+                        (['T', 'ORANGE', 'Heavy Traffic Areas', 'Allow extra travel time'], 8),
+                        (['—', 'BLUE', 'Complete Route Path', 'Follow GPS navigation'], 8)
                     ]
                     
                     # FIXED: Use proper table rendering method
@@ -5240,12 +5629,12 @@ class PDFGenerator:
                     
                     services_legend = [
                         ['SYMBOL', 'COLOR', 'SERVICE TYPE', 'DESCRIPTION'],
-                        ['H', 'BLUE', 'Hospitals', 'Emergency medical services'],
-                        ['P', 'BLUE', 'Police Stations', 'Law enforcement & security'],
-                        ['F', 'BLUE', 'Fire Stations', 'Fire & rescue services'],
-                        ['G', 'GREEN', 'Gas Stations', 'Fuel & vehicle services'],
-                        ['S', 'YELLOW', 'Schools', 'Speed limit zones (40 km/h)'],
-                        ['R', 'ORANGE', 'Restaurants', 'Food & rest stops']
+                        (['H', 'BLUE', 'Hospitals', 'Emergency medical services'], 6),
+                        (['P', 'BLUE', 'Police Stations', 'Law enforcement & security'], 6),
+                        (['F', 'BLUE', 'Fire Stations', 'Fire & rescue services'], 6),
+                        (['G', 'GREEN', 'Gas Stations', 'Fuel & vehicle services'], 6),
+                        (['S', 'YELLOW', 'Schools', 'Speed limit zones (40 km/h)'], 8),
+                        (['R', 'ORANGE', 'Restaurants', 'Food & rest stops'], 6)
                     ]
                     
                     # FIXED: Use proper table rendering method with space check
@@ -5335,18 +5724,21 @@ class PDFGenerator:
                     
                     pdf.set_font('Helvetica', '', 8)
                     pdf.set_text_color(0, 0, 0)
-                    for instruction in instructions:
-                        # Check space for each instruction
-                        if pdf.get_y() + 5 > 280:
-                            pdf.add_page()
-                            pdf.set_font('Helvetica', 'B', 10)
-                            pdf.set_text_color(*self.warning_color)
-                            pdf.cell(0, 6, 'MAP USAGE INSTRUCTIONS (CONTINUED):', 0, 1, 'L')
-                            pdf.set_font('Helvetica', '', 8)
-                            pdf.set_text_color(0, 0, 0)
-                        
+                    # Instructions are 4mm rows needing 5mm clearance above 280 - split once
+                    break_after = max(0, int((280 - 5 - pdf.get_y()) // 4) + 1)
+                    for instruction in instructions[:break_after]:
                         pdf.cell(0, 4, instruction, 0, 1, 'L')
                     
+                    if break_after < len(instructions):
+                        pdf.add_page()
+                        pdf.set_font('Helvetica', 'B', 10)
+                        pdf.set_text_color(*self.warning_color)
+                        pdf.cell(0, 6, 'MAP USAGE INSTRUCTIONS (CONTINUED):', 0, 1, 'L')
+                        pdf.set_font('Helvetica', '', 8)
+                        pdf.set_text_color(0, 0, 0)
+                        for instruction in instructions[break_after:]:
+                            pdf.cell(0, 4, instruction, 0, 1, 'L')
+                    
                 except Exception as e:
                     print(f"Error adding comprehensive route map: {e}")
                     pdf.set_font('Helvetica', '', 12)
@@ -5468,19 +5860,18 @@ class PDFGenerator:
             
             y_pos = pdf.get_y()
             
-            # Calculate height needed for this row
-            max_height = 6
-            for i, (cell, width) in enumerate(zip(row, col_widths)):
-                text_len = len(str(cell))
-                if text_len > width // 3:
-                    max_height = max(max_height, 8)
+            # Legend rows carry a precomputed height; plain rows are measured in one pass
+            if isinstance(row, tuple):
+                row, max_height = row
+            else:
+                max_height = 8 if any(len(str(cell)) > width // 3 for cell, width in zip(row, col_widths)) else 6
             
             # Draw each cell in the row
             for i, (cell, width) in enumerate(zip(row, col_widths)):
                 pdf.set_xy(x_start + sum(col_widths[:i]), y_pos)
                 
                 # Clean text and truncate if needed
-                cell_text = self.clean_text_for_pdf(str(cell))
+                cell_text = pdf._pdf_text(cell)
                 max_chars = max(width // 3, 8)
                 if len(cell_text) > max_chars:
                     cell_text = cell_text[:max_chars-3] + '...'
@@ -5497,7 +5888,7 @@ class PDFGenerator:
         pdf.add_section_header("COMPREHENSIVE STORED IMAGES SUMMARY", "info")
         
         # Get all images for this route
-        all_images = self.get_stored_images_from_db(route_id)
+        all_images = self._page_data('images_summary', route_id)
         
         if not all_images:
             pdf.set_font('Helvetica', '', 12)
@@ -5508,6 +5899,7 @@ class PDFGenerator:
         images_by_type = {}
         total_size = 0
         file_status = {'found': 0, 'missing': 0}
+        dir_files = {}  # Directory listing per image folder instead of a stat per image
         
         for img in all_images:
             img_type = img['image_type']
@@ -5520,7 +5912,12 @@ class PDFGenerator:
             total_size += img.get('file_size', 0)
             
             # Check file existence
-            if img['file_path'] and os.path.exists(img['file_path']):
+            file_path = img['file_path']
+            if file_path:
+                dir_path, file_name = os.path.split(file_path)
+                if dir_path not in dir_files:
+                    dir_files[dir_path] = self._list_files(dir_path or '.')
+            if file_path and file_name in dir_files[dir_path]:
                 file_status['found'] += 1
             else:
                 file_status['missing'] += 1
@@ -5631,9 +6028,7 @@ class PDFGenerator:
     
     def _add_traffic_page(self, pdf: 'EnhancedRoutePDF', route_id: str):
         """Add REAL traffic analysis page with database data"""
-        from api.route_api import RouteAPI
-        route_api = RouteAPI(self.db_manager, None)
-        traffic_data = route_api.get_traffic_data(route_id)
+        traffic_data = self._page_data('traffic', route_id)
         
         pdf.add_page()
         pdf.add_section_header("COMPREHENSIVE TRAFFIC ANALYSIS", "warning")
@@ -5718,8 +6113,7 @@ class PDFGenerator:
         
         # Get API usage for this route
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -5739,20 +6133,26 @@ class PDFGenerator:
             # API usage summary
             api_summary = {}
             total_calls = len(api_usage)
-            successful_calls = len([call for call in api_usage if call['success']])
+            successful_calls = 0
+            total_response_time = 0
             
+            # Single pass: per-API aggregates plus overall totals
             for call in api_usage:
                 api_name = call['api_name']
-                if api_name not in api_summary:
-                    api_summary[api_name] = {'calls': 0, 'success': 0, 'total_time': 0, 'errors': []}
-                
-                api_summary[api_name]['calls'] += 1
+                stats = api_summary.get(api_name)
+                if stats is None:
+                    stats = api_summary[api_name] = {'calls': 0, 'success': 0, 'total_time': 0, 'errors': []}
+                
+                response_time = call.get('response_time', 0)
+                stats['calls'] += 1
+                stats['total_time'] += response_time
+                total_response_time += response_time
                 if call['success']:
-                    api_summary[api_name]['success'] += 1
-                api_summary[api_name]['total_time'] += call.get('response_time', 0)
+                    stats['success'] += 1
+                    successful_calls += 1
                 
                 if call.get('error_message'):
-                    api_summary[api_name]['errors'].append(call['error_message'])
+                    stats['errors'].append(call['error_message'])
             
             # Summary statistics
             overall_success = (successful_calls / total_calls * 100) if total_calls > 0 else 0
@@ -5763,32 +6163,24 @@ class PDFGenerator:
                 ['Failed Calls', f"{total_calls - successful_calls:,}"],
                 ['Overall Success Rate', f"{overall_success:.1f}%"],
                 ['APIs Used', f"{len(api_summary)} different services"],
-                ['Total Response Time', f"{sum(call.get('response_time', 0) for call in api_usage):.3f} seconds"],
-                ['Average Response Time', f"{sum(call.get('response_time', 0) for call in api_usage) / total_calls:.3f}s" if total_calls > 0 else "N/A"]
+                ['Total Response Time', f"{total_response_time:.3f} seconds"],
+                ['Average Response Time', f"{total_response_time / total_calls:.3f}s" if total_calls > 0 else "N/A"]
             ]
             
             pdf.create_detailed_table(summary_table, [70, 110])
             
             # Success rate indicator
             pdf.ln(10)
-            if overall_success >= 90:
-                status_color = self.success_color
-                status_text = "EXCELLENT API PERFORMANCE"
-            elif overall_success >= 75:
-                status_color = self.info_color
-                status_text = "GOOD API PERFORMANCE"
-            elif overall_success >= 50:
-                status_color = self.warning_color
-                status_text = "MODERATE API PERFORMANCE"
-            else:
-                status_color = self.danger_color
-                status_text = "POOR API PERFORMANCE"
+            color_attr, status_text = self._API_PERFORMANCE_TIERS[
+                bisect.bisect_right(self._API_PERFORMANCE_THRESHOLDS, overall_success)]
+            status_color = getattr(self, color_attr)
             
+            banner_y = pdf.get_y()
             pdf.set_fill_color(*status_color)
-            pdf.rect(10, pdf.get_y(), 190, 12, 'F')
+            pdf.rect(10, banner_y, 190, 12, 'F')
             pdf.set_text_color(255, 255, 255)
             pdf.set_font('Helvetica', 'B', 12)
-            pdf.set_xy(15, pdf.get_y() + 2)
+            pdf.set_xy(15, banner_y + 2)
             pdf.cell(180, 8, f'API PERFORMANCE: {status_text} ({overall_success:.1f}%)', 0, 1, 'C')
             
             # Detailed API breakdown
@@ -5802,18 +6194,20 @@ class PDFGenerator:
             
             pdf.create_table_header(headers, col_widths)
             
-            for api_name, stats in api_summary.items():
-                success_rate = (stats['success'] / stats['calls'] * 100) if stats['calls'] > 0 else 0
-                avg_time = (stats['total_time'] / stats['calls']) if stats['calls'] > 0 else 0
-                status = 'Working' if success_rate >= 80 else 'Issues' if success_rate >= 50 else 'Failed'
-                
-                row_data = [
-                    api_name.replace('_', ' ').title(),
+            # Every summarised API has at least one call, so no zero-division guards
+            success_rates = [stats['success'] * 100 / stats['calls'] for stats in api_summary.values()]
+            rows = [
+                [
+                    _pretty_api_name(api_name),
                     str(stats['calls']),
                     f"{success_rate:.1f}%",
-                    f"{avg_time:.3f}s",
-                    status
+                    f"{stats['total_time'] / stats['calls']:.3f}s",
+                    self._API_STATUS_LABELS[bisect.bisect_right(self._API_STATUS_THRESHOLDS, success_rate)]
                 ]
+                for (api_name, stats), success_rate in zip(api_summary.items(), success_rates)
+            ]
+            
+            for row_data in rows:
                 pdf.create_table_row(row_data, col_widths)
         
         else:
@@ -5826,47 +6220,144 @@ class PDFGenerator:
         pdf.set_text_color(*self.info_color)
         pdf.cell(0, 8, 'SYSTEM STATUS & RECOMMENDATIONS', 0, 1, 'L')
         
-        system_recommendations = [
-            "* Monitor API response times to ensure optimal performance",
-            "* Implement retry mechanisms for failed API calls",
-            "* Cache frequently requested data to reduce API usage",
-            "* Set up monitoring alerts for API failures or slowdowns",
-            "* Consider backup API providers for critical services",
-            "* Regularly review API usage against rate limits and costs"
-        ]
-        
         pdf.set_font('Helvetica', '', 10)
         pdf.set_text_color(0, 0, 0)
-        for rec in system_recommendations:
-            pdf.cell(0, 6, rec, 0, 1, 'L')
+        pdf.multi_cell(0, 6, self._SYSTEM_RECOMMENDATIONS_TEXT, 0, 'L')
 
 
 class EnhancedRoutePDF(FPDF):
     """Enhanced PDF class with Unicode handling"""
     
-    def __init__(self, pdf_generator):
+    # Registered Unicode font family replacing Helvetica (None = ASCII cleaning)
+    _unicode_family = None
+    
+    # Glyph sets of the Unicode font files, shared by every document in the process
+    _GLYPHS_CACHE: Dict[str, frozenset] = {}
+    
+    def __init__(self, pdf_generator, unicode_font: bool = False):
+        # fpdf2 (pinned in requirements.txt) already appends page content to
+        # bytearray buffers in _out, so output stays linear in page count
         super().__init__()
         self.pdf_generator = pdf_generator
         self.set_auto_page_break(auto=True, margin=15)
         
+        if unicode_font:
+            self._register_unicode_font()
+        
         # HPCL color scheme
         self.primary_color = (0, 82, 147)
         self.danger_color = (220, 53, 69)
         self.warning_color = (253, 126, 20)
         self.success_color = (40, 167, 69)
         self.info_color = (0, 82, 147)
+        
+        # Column layout of the table being drawn (see begin_table)
+        self._table_widths = None
+        self._col_offsets = []
+        self._col_max_chars = []
+        
+        # Generation time shared by the title page, page headers and file name
+        self.generated_at = datetime.datetime.now()
+        self._date_str = self.generated_at.strftime('%B %d, %Y')
+        
+        # Page-invariant header band and footer rule as pre-serialized operators,
+        # wrapped in q/Q so the graphics state seen by page content is unchanged.
+        # Text still goes through cell() so fpdf2 registers the font per page.
+        r, g, b = (c / 255 for c in self.primary_color)
+        self._header_band_ops = (f"q {r:.3f} {g:.3f} {b:.3f} rg "
+                                 f"0.00 {self.h * self.k:.2f} {210 * self.k:.2f} {-25 * self.k:.2f} re f Q")
+        self._footer_rule_ops = (f"q 0 G {0.5 * self.k:.2f} w "
+                                 f"{10 * self.k:.2f} {20 * self.k:.2f} m {200 * self.k:.2f} {20 * self.k:.2f} l S Q")
+        # Title page backdrop: light page background and the 90mm branding band
+        self._title_backdrop_ops = (f"q {245 / 255:.3f} {248 / 255:.3f} {252 / 255:.3f} rg "
+                                    f"0.00 {self.h * self.k:.2f} {210 * self.k:.2f} {-297 * self.k:.2f} re f "
+                                    f"{r:.3f} {g:.3f} {b:.3f} rg "
+                                    f"0.00 {self.h * self.k:.2f} {210 * self.k:.2f} {-90 * self.k:.2f} re f Q")
+    
+    def _register_unicode_font(self):
+        """Register DejaVu Sans for all styles, keeping ASCII cleaning if it is missing"""
+        font_dirs = [os.path.join('static', 'fonts')]
+        try:
+            import matplotlib
+            font_dirs.append(os.path.join(matplotlib.get_data_path(), 'fonts', 'ttf'))
+        except ImportError:
+            pass
+        
+        for font_dir in font_dirs:
+            font_paths = {style: os.path.join(font_dir, name) for style, name in _UNICODE_FONT_FILES.items()}
+            if not all(os.path.exists(path) for path in font_paths.values()):
+                continue
+            try:
+                for style, path in font_paths.items():
+                    self.add_font('DejaVu', style, path)
+                self._unicode_family = 'dejavu'
+                regular_path = font_paths['']
+                if regular_path not in self._GLYPHS_CACHE:
+                    self._GLYPHS_CACHE[regular_path] = frozenset(self.fonts['dejavu'].cmap)
+                self._glyphs = self._GLYPHS_CACHE[regular_path]
+                print(f"🔤 Using Unicode font from {font_dir}")
+            except Exception as e:
+                print(f"Warning: Unicode font could not be loaded: {e}")
+            return
+        print("Warning: Unicode font not found, falling back to ASCII text cleaning")
+    
+    def _pdf_text(self, txt) -> str:
+        """Text made safe for the active font family"""
+        text = str(txt)
+        if self._unicode_family is None:
+            return _clean(text)
+        return _clean_for_glyphs(text, self._glyphs)
+    
+    def set_font(self, family=None, style='', size=0):
+        """Route the core Helvetica font to the Unicode font when one is registered"""
+        if self._unicode_family and family and family.lower() == 'helvetica':
+            family = self._unicode_family
+        return super().set_font(family, style, size)
+    
+    @staticmethod
+    def _device_color(r, g=-1, b=-1):
+        """Color as fpdf2 stores it (same conversion as its color setters)"""
+        if isinstance(r, (DeviceGray, DeviceRGB)):
+            return r
+        if isinstance(r, (tuple, list)):
+            r, g, b = r
+        if (r, g, b) == (0, 0, 0) or g == -1:
+            return DeviceGray(r / 255)
+        return DeviceRGB(r / 255, g / 255, b / 255)
+    
+    def set_draw_color(self, r, g=-1, b=-1):
+        """Skip the stroke color operator when the color is already active"""
+        if self.page > 0 and self._device_color(r, g, b) == self.draw_color:
+            return
+        super().set_draw_color(r, g, b)
+    
+    def set_fill_color(self, r, g=-1, b=-1):
+        """Skip the fill color operator when the color is already active"""
+        if self.page > 0 and self._device_color(r, g, b) == self.fill_color:
+            return
+        super().set_fill_color(r, g, b)
     
     def cell(self, w, h=0, txt='', border=0, ln=0, align='', fill=False, link=''):
         """Override cell method to clean Unicode characters"""
         if txt:
-            txt = self.pdf_generator.clean_text_for_pdf(str(txt))
+            txt = self._pdf_text(txt)
+        return super().cell(w, h, txt, border, ln, align, fill, link)
+
+    def _raw_cell(self, w, h=0, txt='', border=0, ln=0, align='', fill=False, link=''):
+        """Draw cell with text known to be PDF-safe, bypassing the Unicode cleaner"""
         return super().cell(w, h, txt, border, ln, align, fill, link)
 
-    def multi_cell(self, w, h, txt='', border=0, align='J', fill=False, split_only=False):
+    def multi_cell(self, w, h=None, txt='', *args, **kwargs):
         """Override multi_cell method to clean Unicode characters"""
+        # fpdf2 calls itself back with text= for dry runs
+        txt = kwargs.pop('text', txt)
         if txt:
-            txt = self.pdf_generator.clean_text_for_pdf(str(txt))
-        return super().multi_cell(w, h, txt, border, align, fill, split_only)
+            txt = self._pdf_text(txt)
+        return super().multi_cell(w, h, txt, *args, **kwargs)
+    
+    def split_lines(self, w, h, txt) -> List[str]:
+        """Lines multi_cell would render txt as in the current font, without drawing"""
+        return self.multi_cell(w, h, txt, dry_run=True, output=MethodReturnValue.LINES)
     
     def header(self):
         """Enhanced page header with HPCL branding"""
@@ -5874,46 +6365,41 @@ class EnhancedRoutePDF(FPDF):
             return
         
         # Header background
-        self.set_fill_color(*self.primary_color)
-        self.rect(0, 0, 210, 25, 'F')
+        self._out(self._header_band_ops)
         
         # HPCL branding
         self.set_font('Helvetica', 'B', 12)
         self.set_text_color(255, 255, 255)
         self.set_xy(10, 8)
-        self.cell(0, 8, 'HPCL - Journey Risk Management Study (AI-Powered Analysis)', 0, 0, 'L')
+        self._raw_cell(0, 8, 'HPCL - Journey Risk Management Study (AI-Powered Analysis)', 0, 0, 'L')
         
         # Page number
         self.set_xy(-50, 8)
-        self.cell(0, 8, f'Page {self.page_no()}', 0, 0, 'R')
+        self._raw_cell(0, 8, f'Page {self.page_no()}', 0, 0, 'R')
         
         # Date
         self.set_xy(-80, 16)
         self.set_font('Helvetica', '', 8)
-        self.cell(0, 5, datetime.datetime.now().strftime('%B %d, %Y'), 0, 0, 'R')
+        self._raw_cell(0, 5, self._date_str, 0, 0, 'R')
         
         self.ln(10)
     
     def footer(self):
         """Enhanced page footer"""
-        self.set_y(-20)
-        
         # Footer line
-        self.set_draw_color(0,0,0)
-        self.set_line_width(0.5)
-        self.line(10, self.get_y(), 200, self.get_y())
+        self._out(self._footer_rule_ops)
         
         # Footer text
         self.set_font('Helvetica', 'I', 8)
         self.set_text_color(*self.primary_color)
         self.set_y(-15)
-        self.cell(0, 5, 'Generated by HPCL Journey Risk Management System - Complete Enhanced Analysis', 0, 0, 'C')
+        self._raw_cell(0, 5, 'Generated by HPCL Journey Risk Management System - Complete Enhanced Analysis', 0, 0, 'C')
         
         # Confidentiality notice
         self.set_y(-10)
         self.set_font('Helvetica', '', 7)
         self.set_text_color(100, 100, 100)
-        self.cell(0, 5, 'CONFIDENTIAL - For Internal Use Only', 0, 0, 'C')
+        self._raw_cell(0, 5, 'CONFIDENTIAL - For Internal Use Only', 0, 0, 'C')
     
     def add_section_header(self, title: str, color_type: str = 'primary'):
         """Add enhanced section header with professional styling"""
@@ -5947,14 +6433,23 @@ class EnhancedRoutePDF(FPDF):
         
         self.ln(8)
     
+    @staticmethod
+    def _trunc(value, limit: int) -> str:
+        """Truncate to limit characters, skipping str()/slicing when not needed"""
+        text = value if type(value) is str else str(value)
+        return text if len(text) <= limit else text[:limit]
+    
     def create_detailed_table(self, data: List[List[str]], col_widths: List[int]):
         """Create detailed table with enhanced formatting and Unicode cleaning"""
         self.set_font('Helvetica', '', 10)
         self.set_text_color(0, 0, 0)
         
+        rows_left = self._rows_fitting(8, 260)
         for i, row in enumerate(data):
-            if self.get_y() > 260:
+            if not rows_left:
                 self.add_page()
+                rows_left = self._rows_fitting(8, 260)
+            rows_left -= 1
             
             y_pos = self.get_y()
             
@@ -5967,48 +6462,71 @@ class EnhancedRoutePDF(FPDF):
             # First column (bold) - text will be cleaned by overridden cell method
             self.set_font('Helvetica', 'B', 10)
             self.set_xy(10, y_pos)
-            self.cell(col_widths[0], 8, str(row[0])[:40], 1, 0, 'L', True)
+            self.cell(col_widths[0], 8, self._trunc(row[0], 40), 1, 0, 'L', True)
             
             # Second column - text will be cleaned by overridden cell method
             self.set_font('Helvetica', '', 10)
             self.set_xy(10 + col_widths[0], y_pos)
-            self.cell(col_widths[1], 8, str(row[1])[:60], 1, 0, 'L', True)
+            self.cell(col_widths[1], 8, self._trunc(row[1], 60), 1, 0, 'L', True)
             
             self.ln(8)
         
         self.ln(5)
     
+    def stroke_lines(self, segments: List[Tuple[float, float, float, float]]) -> None:
+        """Stroke (x1, y1, x2, y2) segments as one path in the current draw color and width"""
+        if not segments:
+            return
+        k, h = self.k, self.h
+        self._out(' '.join(
+            f"{x1 * k:.2f} {(h - y1) * k:.2f} m {x2 * k:.2f} {(h - y2) * k:.2f} l"
+            for x1, y1, x2, y2 in segments) + ' S')
+    
+    def _rows_fitting(self, row_height: float, limit_y: float) -> int:
+        """Count rows that can start at or above limit_y from the current position"""
+        return max(0, int((limit_y - self.get_y()) // row_height) + 1)
+    
+    def begin_table(self, col_widths: List[int]):
+        """Precompute column offsets and character limits for the following rows"""
+        self._table_widths = list(col_widths)
+        self._col_offsets = list(itertools.accumulate(col_widths[:-1], initial=10))
+        self._col_max_chars = [max(width // 3, 8) for width in col_widths]
+    
     def create_table_header(self, headers: List[str], col_widths: List[int]):
         """Create enhanced table header with Unicode cleaning"""
+        self.begin_table(col_widths)
         self.set_font('Helvetica', 'B', 10)
         self.set_fill_color(255, 255, 255)
         self.set_text_color(0, 0, 0)
         self.set_draw_color(0, 0, 0)
         
-        for i, (header, width) in enumerate(zip(headers, col_widths)):
-            self.set_xy(10 + sum(col_widths[:i]), self.get_y())
+        y_pos = self.get_y()
+        for x_pos, header, width in zip(self._col_offsets, headers, col_widths):
+            self.set_xy(x_pos, y_pos)
             # Text will be cleaned by overridden cell method
             self.cell(width, 12, header, 1, 0, 'C', True)
         self.ln(12)
     
     def create_table_row(self, row_data: List[str], col_widths: List[int]):
         """Create enhanced table row with Unicode cleaning"""
+        if col_widths != self._table_widths:
+            self.begin_table(col_widths)
+        
         if self.get_y() > 270:
             self.add_page()
         
+        # Row style is set on every row, whatever was drawn before it; unchanged
+        # fonts and colors emit no operators
         self.set_font('Helvetica', '', 8)
         self.set_fill_color(255, 255, 255)
         self.set_text_color(0, 0, 0)
         self.set_draw_color(0, 0, 0)
         
-        y_pos = self.get_y()
+        # Position once - each cell (ln=0) advances x by its own width
+        self.set_xy(10, self.get_y())
         
-        for i, (cell, width) in enumerate(zip(row_data, col_widths)):
-            self.set_xy(10 + sum(col_widths[:i]), y_pos)
-            # Adjust text length based on column width
-            max_chars = max(width//3, 8)
-            cell_text = str(cell)[:max_chars]
+        for cell, width, max_chars in zip(row_data, col_widths, self._col_max_chars):
             # Text will be cleaned by overridden cell method
-            self.cell(width, 8, cell_text, 1, 0, 'L', True)
+            self.cell(width, 8, str(cell)[:max_chars], 1, 0, 'L', True)
         
-        self.ln(8)
\ No newline at end of file
+        self.ln(8)
@@ -0,0 +1,71 @@
+# tests/test_pdf_generator.py - Report text and risk zone helpers
+# Purpose: Pin PDF generator behaviour that changes what a report shows
+# Run with: python -m pytest -q
+
+import pytest
+
+from database.db_manager import DatabaseManager
+from pdf.pdf_generator import EnhancedRoutePDF, PDFGenerator
+
+
+def _zone(zone_type, lat, lng, source):
+    return {'type': zone_type, 'latitude': lat, 'longitude': lng, '_source': source}
+
+
+def test_dedupe_keeps_nearby_zones_of_one_source():
+    zones = [
+        _zone('Sharp Turn #1', 29.80005, 77.45864, 'sharp_turns'),
+        _zone('Sharp Turn #2', 29.80005, 77.45864, 'sharp_turns'),
+        _zone('Sharp Turn #3', 29.80041, 77.45881, 'sharp_turns'),
+    ]
+    assert PDFGenerator._dedupe_risk_zones(zones) == zones
+
+
+def test_dedupe_drops_lower_ranked_zone_of_another_source_in_the_same_cell():
+    zones = [
+        _zone('Communication Dead Zone #1', 28.94966, 77.65908, 'network_coverage'),
+        _zone('Poor Visibility Zone', 28.94966, 77.65908, 'environmental_risks'),
+        _zone('Wildlife Sanctuary Zone', 29.30456, 77.42177, 'environmental_risks'),
+    ]
+    kept = PDFGenerator._dedupe_risk_zones(zones)
+    assert [zone['type'] for zone in kept] == ['Communication Dead Zone #1', 'Wildlife Sanctuary Zone']
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    # PDFGenerator creates its reports/ and images/ directories in the working directory
+    monkeypatch.chdir(tmp_path)
+    return PDFGenerator(DatabaseManager(str(tmp_path / 'route_analysis.db')))
+
+
+@pytest.fixture
+def pdf(generator):
+    pdf = EnhancedRoutePDF(generator)
+    pdf.add_page()
+    pdf.set_font('Helvetica', '', 10)
+    return pdf
+
+
+GUIDELINE = ("Maintain a safe following distance, reduce speed on ghat sections "
+             "and stop at designated rest areas every two hours")
+
+
+def test_wrap_text_fills_each_line_to_the_measured_width(generator, pdf):
+    lines = generator._wrap_text(pdf, GUIDELINE, 60)
+    assert ' '.join(lines) == GUIDELINE
+    assert all(pdf.get_string_width(line) <= 60 for line in lines)
+    # The next word would not have fit on any line
+    for line, following in zip(lines, lines[1:]):
+        assert pdf.get_string_width(f"{line} {following.split()[0]}") > 60
+    assert len(lines) == 4
+
+
+def test_wrap_text_cleans_text_for_the_core_font(generator, pdf):
+    assert generator._wrap_text(pdf, "Mumbai – Pune", 180) == ["Mumbai - Pune"]
+
+
+def test_line_counts_match_multi_cell(generator, pdf):
+    texts = ["NH48", "Mumbai – Pune", GUIDELINE, "First line\nSecond line"]
+    expected = [len(pdf.split_lines(96, 5, text)) for text in texts]
+    assert generator._line_counts(pdf, texts, 96) == expected
+    assert expected[0] == 1 and expected[2] > 1
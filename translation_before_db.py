@@ -31,6 +31,9 @@ except ImportError:
     TEXTBLOB_AVAILABLE = False
     print("⚠️ textblob not installed. Install with: pip install textblob")
 
+# Runs of non-ASCII characters, replaced in one C-level pass
+_NON_ASCII_RUN = re.compile(r'[^\x00-\x7f]+')
+
 class TextTranslator:
     """Translate text to English before database storage"""
     
@@ -66,8 +69,10 @@ class TextTranslator:
             return True
             
         # Check for non-ASCII characters (likely non-English)
-        non_ascii_count = sum(1 for char in text if ord(char) > 127)
+        if text.isascii():
+            return True
         total_chars = len(text)
+        non_ascii_count = total_chars - len(text.encode('ascii', 'ignore'))
         
         # If more than 20% non-ASCII characters, likely not English
         if total_chars > 0 and (non_ascii_count / total_chars) > 0.2:
@@ -139,7 +144,7 @@ class TextTranslator:
     def _extract_ascii_fallback(self, text: str) -> str:
         """Fallback method when no translator is available"""
         # Extract ASCII characters and add note
-        ascii_chars = ''.join(char if ord(char) <= 127 else ' ' for char in text)
+        ascii_chars = _NON_ASCII_RUN.sub(' ', text)
         ascii_text = ' '.join(ascii_chars.split()).strip()
         
         if ascii_text: